@@ -1,9 +1,11 @@
 """Agent base classes and example agents for Agent Duel."""
 
 from .base import (
+    AGENT_LOGGER_NAME,
     AgentBase,
     AgentLoadError,
     AgentProtocol,
+    configure_agent_logging,
     get_agent_game,
     load_agent,
 )
@@ -14,4 +16,6 @@ __all__ = [
     "AgentLoadError",
     "load_agent",
     "get_agent_game",
+    "configure_agent_logging",
+    "AGENT_LOGGER_NAME",
 ]
@@ -1,8 +1,9 @@
 """Agent loader - loads user's agent module."""
 
-import importlib.util
+import os
 import sys
-from pathlib import Path
+import threading
+from types import ModuleType
 from typing import Protocol
 
 
@@ -29,6 +30,9 @@ class AgentProtocol(Protocol):
 class AgentBase:
     """Base class for user agents."""
 
+    # Subclasses keep a __dict__ unless they declare their own __slots__
+    __slots__ = ()
+
     def on_match_start(self, match_info: dict) -> None:
         """
         Called once at the very start of a match.
@@ -119,6 +123,121 @@ class AgentLoadError(Exception):
     pass
 
 
+# Logger the example agents report their progress on
+AGENT_LOGGER_NAME = "agentduel.agent"
+
+
+def configure_agent_logging(level: int | str = "INFO", stream=None) -> None:
+    """
+    Show agents' progress messages, logged on ``AGENT_LOGGER_NAME``.
+
+    Unless logging is already set up for that logger (by the runner, or on
+    the root logger), adds a handler writing bare messages to ``stream``
+    (stdout by default) at ``level``, so they appear as plain printed lines.
+    ``load_agent`` calls this; configure logging before loading an agent to
+    send the messages elsewhere, or set the logger's level to WARNING to
+    silence them.
+    """
+    # Deferred so importing AgentBase alone doesn't pull in logging
+    import logging
+
+    logger = logging.getLogger(AGENT_LOGGER_NAME)
+    if logger.hasHandlers():
+        return
+
+    handler = logging.StreamHandler(sys.stdout if stream is None else stream)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(level)
+
+
+# Executed agent modules keyed by (resolved path, mtime in ns), stored with
+# the agent class found in them and its GAME property. Reloading an unchanged
+# file reuses the entry instead of executing the module body again.
+_AGENT_MODULE_CACHE: dict[
+    tuple[str, int], tuple[ModuleType, type | None, str | None]
+] = {}
+_AGENT_MODULE_CACHE_LOCK = threading.Lock()
+
+
+def _inspect_module(module: ModuleType) -> tuple[type | None, str | None]:
+    """Find the agent class in a module and its GAME property, in one pass."""
+    # First, look for a class named 'Agent' - the common case needs no scan
+    agent_class = getattr(module, "Agent", None)
+    if agent_class is not None:
+        return agent_class, getattr(agent_class, "GAME", None)
+
+    # Look for any class that inherits from AgentBase or has required methods
+    base = AgentBase
+    for obj in module.__dict__.values():
+        if isinstance(obj, type) and obj is not base and hasattr(obj, "on_turn"):
+            return obj, getattr(obj, "GAME", None)
+
+    return None, None
+
+
+def _load_user_module(
+    path: str, mtime_ns: int
+) -> tuple[ModuleType, type | None, str | None]:
+    """
+    Execute the agent file at ``path`` and inspect it.
+
+    ``path`` must already be resolved and ``mtime_ns`` taken from the same
+    ``os.stat`` call that confirmed the file exists.
+
+    Results are cached by path and modification time, so ``get_agent_game``
+    followed by ``load_agent`` on the same file runs the module body once.
+
+    Returns:
+        The module, its agent class (or None), and the class's GAME property.
+
+    Raises:
+        AgentLoadError: If the module cannot be loaded.
+    """
+    key = (path, mtime_ns)
+    entry = _AGENT_MODULE_CACHE.get(key)
+    if entry is not None:
+        return entry
+
+    with _AGENT_MODULE_CACHE_LOCK:
+        entry = _AGENT_MODULE_CACHE.get(key)
+        if entry is not None:
+            return entry
+
+        # Deferred so importing AgentBase alone doesn't pull in the loader
+        import hashlib
+        import importlib.machinery
+        import importlib.util
+
+        # Unique name per path so several agents can be loaded side by side
+        digest = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+        module_name = f"user_agent_{digest}"
+        try:
+            # SourceFileLoader reuses the __pycache__ bytecode when it's fresh
+            # and writes it when it isn't, so only the first load parses source
+            loader = importlib.machinery.SourceFileLoader(module_name, path)
+            spec = importlib.util.spec_from_loader(module_name, loader)
+            if spec is None:
+                raise AgentLoadError(f"Failed to load module from: {path}")
+
+            module = importlib.util.module_from_spec(spec)
+            sys.modules[module_name] = module
+            spec.loader.exec_module(module)
+        except Exception as e:
+            sys.modules.pop(module_name, None)
+            if isinstance(e, AgentLoadError):
+                raise
+            raise AgentLoadError(f"Failed to load agent module: {e}")
+
+        entry = (module, *_inspect_module(module))
+
+        # Drop entries for older versions of the same file
+        for stale in [k for k in _AGENT_MODULE_CACHE if k[0] == path]:
+            del _AGENT_MODULE_CACHE[stale]
+        _AGENT_MODULE_CACHE[key] = entry
+        return entry
+
+
 def load_agent(agent_path: str, expected_game: str | None = None) -> AgentBase:
     """
     Load an agent from a Python file.
@@ -137,41 +256,18 @@ def load_agent(agent_path: str, expected_game: str | None = None) -> AgentBase:
     Raises:
         AgentLoadError: If agent cannot be loaded or game type doesn't match.
     """
-    path = Path(agent_path).resolve()
+    path = os.path.realpath(agent_path)
 
-    if not path.exists():
+    try:
+        st = os.stat(path)
+    except OSError:
         raise AgentLoadError(f"Agent file not found: {path}")
 
-    if not path.suffix == ".py":
+    if not path.endswith(".py"):
         raise AgentLoadError(f"Agent file must be a Python file: {path}")
 
-    # Load the module
-    try:
-        spec = importlib.util.spec_from_file_location("user_agent", path)
-        if spec is None or spec.loader is None:
-            raise AgentLoadError(f"Failed to load module from: {path}")
-
-        module = importlib.util.module_from_spec(spec)
-        sys.modules["user_agent"] = module
-        spec.loader.exec_module(module)
-    except Exception as e:
-        raise AgentLoadError(f"Failed to load agent module: {e}")
-
-    # Find the agent class
-    agent_class = None
-
-    # First, look for a class named 'Agent'
-    if hasattr(module, "Agent"):
-        agent_class = module.Agent
-    else:
-        # Look for any class that inherits from AgentBase or has required methods
-        for name in dir(module):
-            obj = getattr(module, name)
-            if isinstance(obj, type) and obj is not AgentBase:
-                # Check if it has the required methods
-                if hasattr(obj, "on_turn"):
-                    agent_class = obj
-                    break
+    # Load the module and find the agent class
+    _, agent_class, agent_game = _load_user_module(path, st.st_mtime_ns)
 
     if agent_class is None:
         raise AgentLoadError(
@@ -179,7 +275,6 @@ def load_agent(agent_path: str, expected_game: str | None = None) -> AgentBase:
         )
 
     # Check GAME property if expected_game is specified
-    agent_game = getattr(agent_class, "GAME", None)
     if expected_game and agent_game:
         if agent_game != expected_game:
             raise AgentLoadError(
@@ -187,18 +282,20 @@ def load_agent(agent_path: str, expected_game: str | None = None) -> AgentBase:
                 f"Please use an agent for the correct game."
             )
 
+    # Verify the class implements the required method before instantiating
+    on_turn = getattr(agent_class, "on_turn", None)
+    if not callable(on_turn) or on_turn is AgentBase.on_turn:
+        raise AgentLoadError("Agent must have an 'on_turn' method")
+
+    # Agents log their progress; make sure it's shown somewhere
+    configure_agent_logging()
+
     # Instantiate and return
     try:
-        agent = agent_class()
+        return agent_class()
     except Exception as e:
         raise AgentLoadError(f"Failed to instantiate agent: {e}")
 
-    # Verify it has the required method
-    if not hasattr(agent, "on_turn") or not callable(agent.on_turn):
-        raise AgentLoadError("Agent must have an 'on_turn' method")
-
-    return agent
-
 
 def get_agent_game(agent_path: str) -> str | None:
     """
@@ -206,28 +303,14 @@ def get_agent_game(agent_path: str) -> str | None:
 
     Returns the GAME class property if defined, or None.
     """
-    path = Path(agent_path).resolve()
+    path = os.path.realpath(agent_path)
 
-    if not path.exists() or not path.suffix == ".py":
+    if not path.endswith(".py"):
         return None
 
     try:
-        spec = importlib.util.spec_from_file_location("user_agent_check", path)
-        if spec is None or spec.loader is None:
-            return None
-
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-
-        # Look for Agent class
-        if hasattr(module, "Agent"):
-            return getattr(module.Agent, "GAME", None)
-
-        # Look for any class with GAME and on_turn
-        for name in dir(module):
-            obj = getattr(module, name)
-            if isinstance(obj, type) and hasattr(obj, "on_turn"):
-                return getattr(obj, "GAME", None)
+        _, _, agent_game = _load_user_module(path, os.stat(path).st_mtime_ns)
+        return agent_game
     except Exception:
         pass
 
@@ -10,7 +10,27 @@ This agent does NOT have a GAME property, so it can participate in
 Run with: agentduel match --all --agent examples/aggressive_multi_agent.py
 """
 
-import random
+import logging
+from types import MappingProxyType
+
+logger = logging.getLogger("agentduel.agent")
+
+# Deceptive negotiation messages, one per turn (the last one repeats)
+_DECEPTIVE_MESSAGES = (
+    "I'm definitely going to split, I promise!",
+    "Trust me, I always cooperate.",
+    "Let's both split and be fair about this.",
+    "I've never stolen in my life!",
+)
+_DECEPTIVE_MAX_IDX = len(_DECEPTIVE_MESSAGES) - 1
+
+# Static actions returned as shared singletons - callers must not mutate them
+_STEAL = {"type": "commit", "choice": "steal"}
+_CHALLENGE = {"action_type": "challenge"}
+
+# Face values to bluff on when opening or restarting a bid
+_FACES_456 = (4, 5, 6)
+_FACES_3456 = (3, 4, 5, 6)
 
 
 class Agent:
@@ -18,35 +38,54 @@ class Agent:
 
     # No GAME property - this agent can play any game
 
+    __slots__ = (
+        "round_number",
+        "current_game_type",
+        "all_game_rules",
+        "_rand",
+        "_choice",
+        "_rand01",
+        "_dispatch",
+    )
+
     def __init__(self):
         self.round_number = 0
         self.current_game_type = None
-        self.all_game_rules = {}
+        self.all_game_rules = MappingProxyType({})
+        # Created on the first Liar's Dice turn; other games never need it
+        self._rand = None
+        self._choice = None
+        self._rand01 = None
+        # (game type, phase) -> handler
+        self._dispatch = {
+            ("split-or-steal", "negotiate"): self._sos_negotiate,
+            ("split-or-steal", "commit"): self._sos_commit,
+            ("liars-dice", "bid"): self._dice_bid,
+        }
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
         rounds_per_match = match_info.get("rounds_per_match", 3)
         match_game_id = match_info.get("match_game_id", "all")
-        print(f"Match starting! Mode: {match_game_id}, {rounds_per_match} rounds to play.")
+        logger.info("Match starting! Mode: %s, %s rounds to play.", match_game_id, rounds_per_match)
 
-        # Store rules for reference
+        # Store rules for reference as a read-only view - never copied or mutated
         if match_info.get("all_game_rules"):
-            self.all_game_rules = match_info["all_game_rules"]
+            self.all_game_rules = MappingProxyType(match_info["all_game_rules"])
         else:
-            self.all_game_rules[match_info.get("game_id")] = {
-                "rules": match_info.get("rules"),
-            }
+            self.all_game_rules = MappingProxyType({
+                match_info.get("game_id"): {"rules": match_info.get("rules")},
+            })
 
     def on_round_start(self, round_info: dict) -> None:
         """Called when a new round begins."""
-        self.round_number = round_info.get("round_number", 1)
-        self.current_game_type = round_info.get("game_id", "split-or-steal")
-        print(f"Round {self.round_number} starting: {self.current_game_type}")
+        get = round_info.get
+        self.round_number = get("round_number", 1)
+        self.current_game_type = get("game_id", "split-or-steal")
+        logger.info("Round %s starting: %s", self.round_number, self.current_game_type)
 
     def on_turn(self, game_state: dict) -> dict:
         """Called when it's our turn."""
-        phase = game_state.get("phase")
-
         # Detect game type from state
         if self.current_game_type is None:
             if "your_dice" in game_state:
@@ -54,45 +93,47 @@ class Agent:
             else:
                 self.current_game_type = "split-or-steal"
 
-        if self.current_game_type == "liars-dice":
-            return self._handle_liars_dice(game_state, phase)
-        else:
-            return self._handle_split_or_steal(game_state, phase)
-
-    def _handle_split_or_steal(self, game_state: dict, phase: str) -> dict:
-        """Handle Split or Steal - aggressive strategy (steal)."""
-        if phase == "negotiate":
-            messages = game_state.get("messages", [])
-
-            # Deceptive messages
-            deceptive = [
-                "I'm definitely going to split, I promise!",
-                "Trust me, I always cooperate.",
-                "Let's both split and be fair about this.",
-                "I've never stolen in my life!",
-            ]
-            idx = min(len(messages), len(deceptive) - 1)
-            return {"type": "message", "text": deceptive[idx]}
-
-        elif phase == "commit":
-            # Always steal - aggressive strategy
-            return {"type": "commit", "choice": "steal"}
+        # Every game other than Liar's Dice plays Split or Steal
+        game = "liars-dice" if self.current_game_type == "liars-dice" else "split-or-steal"
+        handler = self._dispatch.get((game, game_state.get("phase")))
+        if handler is not None:
+            return handler(game_state)
 
+        # Game over or unexpected phase
+        if game == "liars-dice":
+            return _CHALLENGE
         return {"type": "message", "text": ""}
 
-    def _handle_liars_dice(self, game_state: dict, phase: str) -> dict:
-        """Handle Liar's Dice - aggressive bluffing strategy."""
-        if phase != "bid":
-            return {"action_type": "challenge"}
+    def _sos_negotiate(self, game_state: dict) -> dict:
+        """Split or Steal negotiation - promise to split."""
+        messages = game_state.get("messages", [])
+
+        # Deceptive messages
+        idx = min(len(messages), _DECEPTIVE_MAX_IDX)
+        return {"type": "message", "text": _DECEPTIVE_MESSAGES[idx]}
+
+    def _sos_commit(self, game_state: dict) -> dict:
+        """Split or Steal commit - aggressive strategy (steal)."""
+        return _STEAL
 
-        current_bid = game_state.get("current_bid")
-        my_dice = game_state.get("your_dice", [])
-        total_dice = game_state.get("total_dice", 10)
+    def _dice_bid(self, game_state: dict) -> dict:
+        """Liar's Dice bid - aggressive bluffing strategy."""
+        if self._rand is None:
+            import random
+
+            self._rand = random.Random()
+            self._choice = self._rand.choice
+            self._rand01 = self._rand.random
+
+        get = game_state.get
+        current_bid = get("current_bid")
+        my_dice = get("your_dice", [])
+        total_dice = get("total_dice", 10)
 
         if current_bid is None:
             # Opening bid - bluff aggressively
             # Bid higher than we actually have
-            face = random.choice([4, 5, 6])
+            face = self._choice(_FACES_456)
             quantity = max(2, len(my_dice) // 2 + 1)
             return {
                 "action_type": "bid",
@@ -105,20 +146,17 @@ class Agent:
 
             # Challenge very high bids
             if bid_quantity >= total_dice - 1:
-                return {"action_type": "challenge"}
+                return _CHALLENGE
 
             # Otherwise, raise aggressively
-            if random.random() < 0.3:
+            if self._rand01() < 0.3:
                 # Sometimes challenge to catch bluffs
-                return {"action_type": "challenge"}
+                return _CHALLENGE
 
-            # Raise the bid
-            if bid_face < 6:
-                new_quantity = bid_quantity
-                new_face = bid_face + 1
-            else:
-                new_quantity = bid_quantity + 1
-                new_face = random.choice([3, 4, 5, 6])
+            # Raise the bid: bump the face, or at six bump quantity and restart
+            at_max = bid_face >= 6
+            new_quantity = bid_quantity + at_max
+            new_face = self._choice(_FACES_3456) if at_max else bid_face + 1
 
             if new_quantity <= total_dice:
                 return {
@@ -127,13 +165,14 @@ class Agent:
                     "face": new_face,
                 }
             else:
-                return {"action_type": "challenge"}
+                return _CHALLENGE
 
     def on_round_end(self, result: dict) -> None:
         """Called when a round ends."""
-        game_id = result.get("game_id", self.current_game_type)
-        your_pts = result.get("your_points", 0)
-        opp_pts = result.get("opponent_points", 0)
+        get = result.get
+        game_id = get("game_id", self.current_game_type)
+        your_pts = get("your_points", 0)
+        opp_pts = get("opponent_points", 0)
 
         if your_pts > opp_pts:
             outcome = "Won"
@@ -142,5 +181,5 @@ class Agent:
         else:
             outcome = "Draw"
 
-        round_num = result.get("round_number")
-        print(f"  Round {round_num}: {outcome} ({game_id}) - {your_pts} vs {opp_pts}")
+        round_num = get("round_number")
+        logger.info("  Round %s: %s (%s) - %s vs %s", round_num, outcome, game_id, your_pts, opp_pts)
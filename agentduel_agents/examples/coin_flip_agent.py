@@ -7,7 +7,9 @@ There's no strategy involved - it's pure luck!
 Run with: agentduel match --agent examples/coin_flip_agent.py
 """
 
-import time
+import logging
+
+logger = logging.getLogger("agentduel.agent")
 
 
 class Agent:
@@ -15,17 +17,19 @@ class Agent:
 
     GAME = "coin-flip"
 
+    __slots__ = ("round_number",)
+
     def __init__(self):
         self.round_number = 0
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
-        print("Coin Flip match starting!")
+        logger.info("Coin Flip match starting!")
 
     def on_round_start(self, round_info: dict) -> None:
         """Called when a new round begins."""
         self.round_number = round_info.get("round_number", 1)
-        print(f"Round {self.round_number} starting.")
+        logger.info("Round %s starting.", self.round_number)
 
     def on_turn(self, game_state: dict) -> dict:
         """
@@ -37,8 +41,7 @@ class Agent:
         phase = game_state.get("phase")
 
         if phase == "flip":
-            print("Flipping the coin...")
-            time.sleep(2)  # Simulate a 2 second delay
+            logger.info("Flipping the coin...")
             return {"type": "flip"}
 
         # Fallback
@@ -50,6 +53,6 @@ class Agent:
         your_pts = result.get("your_points", 0)
 
         if your_pts > 0:
-            print(f"  Coin landed on {coin_result}! We won {your_pts} points!")
+            logger.info("  Coin landed on %s! We won %s points!", coin_result, your_pts)
         else:
-            print(f"  Coin landed on {coin_result}. We lost this round.")
+            logger.info("  Coin landed on %s. We lost this round.", coin_result)
@@ -10,6 +10,340 @@ Usage:
     agentduel match --game er-diagnosis
 """
 
+import logging
+import re
+
+logger = logging.getLogger("agentduel.agent")
+
+# Candidate diagnoses, indexed by the constants below in _decide_guess
+_DIAGNOSES = (
+    "heart attack",
+    "heart failure",
+    "pulmonary embolism",
+    "pneumonia",
+    "asthma exacerbation",
+    "stroke",
+    "appendicitis",
+    "cholecystitis",
+    "pancreatitis",
+    "kidney stones",
+    "meningitis",
+    "migraine",
+    "sepsis",
+    "anaphylaxis",
+)
+(
+    _HEART_ATTACK,
+    _HEART_FAILURE,
+    _PULMONARY_EMBOLISM,
+    _PNEUMONIA,
+    _ASTHMA_EXACERBATION,
+    _STROKE,
+    _APPENDICITIS,
+    _CHOLECYSTITIS,
+    _PANCREATITIS,
+    _KIDNEY_STONES,
+    _MENINGITIS,
+    _MIGRAINE,
+    _SEPSIS,
+    _ANAPHYLAXIS,
+) = range(len(_DIAGNOSES))
+
+# Diagnosis scoring rules as (diagnosis, weight, clauses). A rule adds its
+# weight once if all "+"-joined tokens of any clause are facts: keyword hits
+# or the derived "name=value" / "has_*" / "complaint=*" / "vitals=*" tokens
+# built in _decide_guess.
+_SCORING_RULES = tuple(
+    (dx, weight, tuple(frozenset(clause.split("+")) for clause in clauses))
+    for dx, weight, clauses in (
+        # Heart attack indicators
+        (_HEART_ATTACK, 3, ("pain_type=crushing",)),
+        (_HEART_ATTACK, 3, ("radiation=arm_jaw",)),
+        (_HEART_ATTACK, 2, ("sweating",)),
+        # Heart failure indicators
+        (_HEART_FAILURE, 3, ("breathing=orthopnea",)),
+        (_HEART_FAILURE, 2, ("swelling+leg", "swelling+ankle")),
+        (_HEART_FAILURE, 2, ("gasping+night",)),
+        # PE indicators
+        (_PULMONARY_EMBOLISM, 2, ("onset=sudden+complaint=breath",)),
+        (_PULMONARY_EMBOLISM, 2, ("leg+pain", "leg+swell")),
+        (_PULMONARY_EMBOLISM, 2, ("pain_type=sharp+breath",)),
+        # Pneumonia indicators
+        (_PNEUMONIA, 3, ("has_fever+cough",)),
+        (_PNEUMONIA, 2, ("mucus", "phlegm")),
+        # Asthma indicators
+        (_ASTHMA_EXACERBATION, 3, ("breathing=wheezing",)),
+        # Stroke indicators
+        (_STROKE, 3, ("droop", "weak", "numb")),
+        (_STROKE, 2, ("slur", "speech")),
+        # Appendicitis indicators
+        (_APPENDICITIS, 3, ("lower right", "right lower")),
+        (_APPENDICITIS, 2, ("belly button", "moved")),
+        # Gallbladder indicators
+        (_CHOLECYSTITIS, 2, ("upper right", "right upper")),
+        (_CHOLECYSTITIS, 2, ("fatty", "after eating")),
+        # Pancreatitis indicators
+        (_PANCREATITIS, 2, ("upper+back",)),
+        (_PANCREATITIS, 2, ("lean", "forward")),
+        # Kidney stone indicators
+        (_KIDNEY_STONES, 3, ("radiation=groin",)),
+        (_KIDNEY_STONES, 2, ("wave", "comes and goes")),
+        (_KIDNEY_STONES, 2, ("flank",)),
+        # Meningitis indicators
+        (_MENINGITIS, 3, ("stiff+neck",)),
+        (_MENINGITIS, 2, ("light+sensitiv",)),
+        (_MENINGITIS, 2, ("worst headache",)),
+        # Migraine indicators
+        (_MIGRAINE, 3, ("throbb+one side",)),
+        (_MIGRAINE, 2, ("has_nausea+complaint=head",)),
+        # Sepsis indicators
+        (_SEPSIS, 2, ("confus",)),
+        (_SEPSIS, 2, ("has_fever+very sick",)),
+        # Anaphylaxis indicators
+        (_ANAPHYLAXIS, 2, ("hives", "rash")),
+        (_ANAPHYLAXIS, 3, ("throat+tight",)),
+        # High heart rate
+        (_HEART_ATTACK, 1, ("vitals=high_hr",)),
+        (_PULMONARY_EMBOLISM, 1, ("vitals=high_hr",)),
+        (_SEPSIS, 1, ("vitals=high_hr",)),
+        # Low oxygen
+        (_PULMONARY_EMBOLISM, 2, ("vitals=low_spo2",)),
+        (_PNEUMONIA, 1, ("vitals=low_spo2",)),
+        (_ASTHMA_EXACERBATION, 1, ("vitals=low_spo2",)),
+        # High fever
+        (_PNEUMONIA, 2, ("vitals=high_temp",)),
+        (_MENINGITIS, 2, ("vitals=high_temp",)),
+        (_SEPSIS, 2, ("vitals=high_temp",)),
+        # Low blood pressure
+        (_SEPSIS, 2, ("vitals=low_bp",)),
+        (_ANAPHYLAXIS, 2, ("vitals=low_bp",)),
+    )
+)
+
+# One bit per fact token the rules test, so a set of facts packs into an int
+# and checking a clause is a single mask comparison
+_FACT_BITS = {
+    token: 1 << i
+    for i, token in enumerate(sorted(
+        {token for _, _, clauses in _SCORING_RULES for clause in clauses for token in clause}
+    ))
+}
+
+# Fact tokens that depend only on the chief complaint, and the substring
+# of the complaint that sets each one
+_COMPLAINT_FACTS = (("complaint=breath", "breath"), ("complaint=head", "head"))
+
+# Specialized scorers keyed by the complaint facts they were built for
+_SCORERS: dict = {}
+
+
+def _scorer_for(complaint: str):
+    """
+    Return a scoring function specialized for ``complaint``.
+
+    The complaint is fixed for a whole case, so its fact tokens are folded
+    in ahead of time: rules that need an absent complaint token are dropped
+    and satisfied ones are removed from their clauses. What is left is
+    compiled into straight-line code taking the ``_FACT_BITS`` mask and
+    returning the score list, with one test per distinct condition. Built
+    once per distinct set of complaint facts.
+    """
+    known = frozenset(t for t, needle in _COMPLAINT_FACTS if needle in complaint)
+    scorer = _SCORERS.get(known)
+    if scorer is not None:
+        return scorer
+
+    # Group the remaining rules by condition, so a condition shared by
+    # several diagnoses (the vital-sign rules) is tested once and then
+    # updates every score it feeds
+    complaint_tokens = frozenset(t for t, _ in _COMPLAINT_FACTS)
+    updates_by_test = {}
+    for dx, weight, clauses in _SCORING_RULES:
+        tests = []
+        for clause in clauses:
+            if clause & complaint_tokens - known:
+                continue
+            tokens = clause - known
+            if not tokens:
+                tests = None
+                break
+            tests.append(tokens)
+        if tests is None:
+            updates_by_test.setdefault(None, []).append((dx, weight))
+        elif tests:
+            # Single-token clauses share one "any bit set" test; the rest
+            # need all of their bits
+            any_mask = 0
+            parts = []
+            for tokens in tests:
+                mask = 0
+                for token in tokens:
+                    mask |= _FACT_BITS[token]
+                if len(tokens) == 1:
+                    any_mask |= mask
+                else:
+                    parts.append(f"facts & {mask:#x} == {mask:#x}")
+            if any_mask:
+                parts.insert(0, f"facts & {any_mask:#x}")
+            updates_by_test.setdefault(" or ".join(parts), []).append((dx, weight))
+
+    lines = ["def _score(facts):", f"    s = [0] * {len(_DIAGNOSES)}"]
+    for test, updates in updates_by_test.items():
+        indent = "    "
+        if test is not None:
+            lines.append(f"    if {test}:")
+            indent = "        "
+        lines.extend(f"{indent}s[{dx}] += {weight}" for dx, weight in updates)
+    lines.append("    return s")
+
+    namespace = {}
+    exec(compile("\n".join(lines), "<er-scorer>", "exec"), namespace)
+    scorer = _SCORERS[known] = namespace["_score"]
+    return scorer
+
+
+# Clinical facts gathered during a round, all unknown at the start
+_INFO_TEMPLATE = dict.fromkeys((
+    "pain_location",
+    "pain_type",
+    "pain_radiation",
+    "breathing_issue",
+    "fever",
+    "nausea",
+    "onset",
+    "category",
+))
+
+# Abnormal vital sign readings
+_HR_HIGH = re.compile(r"12[05]|130")
+_SPO2_LOW = re.compile(r"8[89]%|9[01]%")
+_TEMP_HIGH = re.compile(r"10[234]")
+_BP_LOW = re.compile(r"(?:8[05]|90)/")
+
+# Substrings looked for in the Q&A history by _analyze_history and _decide_guess
+_KEYWORDS = (
+    # Pain type
+    "crushing", "pressure", "squeezing", "sharp", "stabbing", "burning",
+    "cramping", "crampy",
+    # Radiation
+    "arm", "jaw", "back", "shoulder", "groin",
+    # Breathing
+    "wheez", "sudden", "breath", "lying", "worse", "flat",
+    # Fever, nausea, onset
+    "fever", "chill", "no fever", "nausea", "vomit", "suddenly", "gradual",
+    "over days",
+    # Specific conditions
+    "stiff neck", "neck stiff", "droop", "slur", "one side", "lower right",
+    "right lower", "hives", "swelling", "thirst", "urination",
+    # Diagnosis scoring
+    "sweating", "leg", "ankle", "gasping", "night", "pain", "swell", "cough",
+    "mucus", "phlegm", "weak", "numb", "speech", "belly button", "moved",
+    "upper right", "right upper", "fatty", "after eating", "upper", "lean",
+    "forward", "wave", "comes and goes", "flank", "stiff", "neck", "light",
+    "sensitiv", "worst headache", "throbb", "confus", "very sick", "rash",
+    "throat", "tight",
+)
+
+# One regex finds every keyword in a single scan. The lookahead lets matches
+# overlap, and longest-first ordering reports the longest keyword starting at
+# each position; the shorter keywords it begins with are added back through
+# _KEYWORD_PREFIXES, so the result equals testing each keyword with `in`.
+_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(re.escape(k) for k in sorted(_KEYWORDS, key=len, reverse=True))
+    + "))"
+)
+# Characters carried over between incremental scans so a keyword split
+# across the old and new parts of the history is still found
+_SCAN_OVERLAP = max(len(k) for k in _KEYWORDS) - 1
+_KEYWORD_PREFIXES = {
+    k: frozenset(p for p in _KEYWORDS if k.startswith(p))
+    for k in _KEYWORDS
+}
+
+
+def _keyword_hits(text: str) -> set:
+    """Return the set of keywords that occur anywhere in ``text``."""
+    hits = set()
+    for match in set(_KEYWORD_RE.findall(text)):
+        hits |= _KEYWORD_PREFIXES[match]
+    return hits
+
+
+def _with_lowered(questions: tuple) -> tuple:
+    """Pair each question with its lowercase form for matching against history."""
+    return tuple((q, q.lower()) for q in questions)
+
+
+_CHEST_QUESTIONS = _with_lowered((
+    "Can you describe the chest pain - is it sharp, dull, or like pressure?",
+    "Does the pain go anywhere else, like your arm, shoulder, or jaw?",
+    "Did the pain start suddenly or gradually?",
+    "Are you having any shortness of breath?",
+    "Have you been sweating more than usual?",
+    "Does the pain change when you breathe deeply?",
+    "Have you had any nausea or felt like vomiting?",
+    "Have you ever had similar pain before?",
+))
+_BREATHING_QUESTIONS = _with_lowered((
+    "Did the breathing difficulty start suddenly or gradually?",
+    "Do you hear any wheezing when you breathe?",
+    "Is it harder to breathe when lying down?",
+    "Have you had any chest pain along with the breathing trouble?",
+    "Have you had any recent leg pain or swelling?",
+    "Do you have a cough? If so, is anything coming up?",
+    "Have you had any fever or chills?",
+    "Do you have a history of asthma or lung problems?",
+))
+_HEAD_QUESTIONS = _with_lowered((
+    "How would you describe the headache - throbbing, constant, or like pressure?",
+    "Is this the worst headache you've ever had?",
+    "Is your neck stiff or painful to move?",
+    "Are you sensitive to light?",
+    "Have you had any weakness or numbness on one side of your body?",
+    "Have you felt nauseous or vomited?",
+    "Have you had any changes in your vision?",
+    "Have you had any fever?",
+))
+_ABDOMEN_QUESTIONS = _with_lowered((
+    "Can you point to exactly where the pain is worst?",
+    "Did the pain start somewhere else and then move?",
+    "Does eating make the pain better or worse?",
+    "Have you been able to have bowel movements?",
+    "Have you had any nausea or vomiting?",
+    "Have you noticed any fever?",
+    "Does the pain go to your back or shoulder?",
+    "Is the pain constant or does it come and go?",
+))
+_GENERAL_QUESTIONS = _with_lowered((
+    "Can you describe your main symptom in more detail?",
+    "When did this start?",
+    "Is it getting worse, better, or staying the same?",
+    "Have you had any fever or chills?",
+    "Have you had any nausea or vomiting?",
+    "Does anything make it better or worse?",
+    "Have you had anything like this before?",
+    "Do you have any other symptoms?",
+))
+
+# Base questions by chief complaint, checked in order; general questions otherwise
+_QUESTIONS_BY_COMPLAINT = (
+    (("chest",), _CHEST_QUESTIONS),
+    (("breath",), _BREATHING_QUESTIONS),
+    (("head",), _HEAD_QUESTIONS),
+    (("belly", "abdomen", "stomach"), _ABDOMEN_QUESTIONS),
+)
+
+# Follow-ups asked first once a category is suspected
+_CARDIAC_FOLLOW_UP = _with_lowered(("Does the pain go to your arm, jaw, or back?",))
+_RESPIRATORY_FOLLOW_UP = _with_lowered(
+    ("Do you notice any wheezing or unusual sounds when breathing?",)
+)
+_NEUROLOGICAL_FOLLOW_UP = _with_lowered(
+    ("Have you noticed any weakness, numbness, or difficulty speaking?",)
+)
+_FALLBACK_QUESTION = "Do you have any other symptoms I should know about?"
+
 
 class Agent:
     """
@@ -21,25 +355,37 @@ class Agent:
 
     GAME = "er-diagnosis"
 
+    __slots__ = (
+        "round",
+        "qa_history",
+        "vital_signs",
+        "chief_complaint",
+        "info",
+        "_scanned_upto",
+        "_last_scanned",
+        "_scan_tail",
+        "_hits",
+        "_hit_bits",
+        "_asked",
+    )
+
     def __init__(self):
         self.round = 0
         self.qa_history = []
         self.vital_signs = {}
         self.chief_complaint = ""
-        self.info = {
-            "pain_location": None,
-            "pain_type": None,
-            "pain_radiation": None,
-            "breathing_issue": None,
-            "fever": None,
-            "nausea": None,
-            "onset": None,
-            "category": None,
-        }
+        self.info = _INFO_TEMPLATE.copy()
+        # Incremental keyword scan of qa_history
+        self._scanned_upto = 0
+        self._last_scanned = None
+        self._scan_tail = ""
+        self._hits = set()
+        self._hit_bits = 0
+        self._asked = set()
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
-        print("ER Diagnosis match starting!")
+        logger.info("ER Diagnosis match starting!")
 
     def on_round_start(self, round_info: dict) -> None:
         """Called at the start of each round with round info."""
@@ -47,7 +393,13 @@ class Agent:
         self.qa_history = []
         self.vital_signs = {}
         self.chief_complaint = ""
-        self.info = {k: None for k in self.info}
+        self.info = _INFO_TEMPLATE.copy()
+        self._scanned_upto = 0
+        self._last_scanned = None
+        self._scan_tail = ""
+        self._hits = set()
+        self._hit_bits = 0
+        self._asked = set()
 
     def on_turn(self, game_state: dict) -> dict:
         """Generate a question or guess based on the game state."""
@@ -67,306 +419,171 @@ class Agent:
 
     def _analyze_history(self):
         """Analyze Q&A history to update our clinical knowledge."""
-        all_text = ""
-        for qa in self.qa_history:
-            question = qa.get("question", "").lower()
-            answer = qa.get("answer", "").lower()
-            all_text += f" {question} {answer}"
+        # The history only grows within a round, so scan just the new entries
+        # and merge their keywords into what earlier turns found. Start over
+        # if the history shrank or its last scanned entry changed.
+        history = self.qa_history
+        start = self._scanned_upto
+        if start and (len(history) < start or history[start - 1] != self._last_scanned):
+            self._scanned_upto = 0
+            self._last_scanned = None
+            self._scan_tail = ""
+            self._hits = set()
+            self._hit_bits = 0
+            self._asked = set()
+
+        if len(history) > self._scanned_upto:
+            # Lowercase each entry once here; later lookups reuse the results
+            parts = [self._scan_tail]
+            for qa in history[self._scanned_upto:]:
+                question = qa.get("question", "").lower()
+                self._asked.add(question)
+                parts.append(question)
+                parts.append(qa.get("answer", "").lower())
+            new_text = " ".join(parts)
+            new_hits = _keyword_hits(new_text) - self._hits
+            self._hits |= new_hits
+            for keyword in new_hits:
+                self._hit_bits |= _FACT_BITS.get(keyword, 0)
+            self._scanned_upto = len(history)
+            self._last_scanned = history[-1]
+            self._scan_tail = new_text[-_SCAN_OVERLAP:]
+        hits = self._hits
 
         # Analyze pain characteristics
-        if "crushing" in all_text or "pressure" in all_text or "squeezing" in all_text:
+        if "crushing" in hits or "pressure" in hits or "squeezing" in hits:
             self.info["pain_type"] = "crushing"
             self.info["category"] = "cardiac"
-        elif "sharp" in all_text or "stabbing" in all_text:
+        elif "sharp" in hits or "stabbing" in hits:
             self.info["pain_type"] = "sharp"
-        elif "burning" in all_text:
+        elif "burning" in hits:
             self.info["pain_type"] = "burning"
-        elif "cramping" in all_text or "crampy" in all_text:
+        elif "cramping" in hits or "crampy" in hits:
             self.info["pain_type"] = "cramping"
             self.info["category"] = "gi"
 
         # Analyze radiation
-        if "arm" in all_text or "jaw" in all_text:
+        if "arm" in hits or "jaw" in hits:
             self.info["pain_radiation"] = "arm_jaw"
             self.info["category"] = "cardiac"
-        elif "back" in all_text and "shoulder" in all_text:
+        elif "back" in hits and "shoulder" in hits:
             self.info["pain_radiation"] = "back_shoulder"
             self.info["category"] = "gi"  # gallbladder or pancreatitis
-        elif "groin" in all_text:
+        elif "groin" in hits:
             self.info["pain_radiation"] = "groin"
             self.info["category"] = "other"  # kidney stones
 
         # Analyze breathing
-        if "wheez" in all_text:
+        if "wheez" in hits:
             self.info["breathing_issue"] = "wheezing"
             self.info["category"] = "respiratory"
-        elif "sudden" in all_text and "breath" in all_text:
+        elif "sudden" in hits and "breath" in hits:
             self.info["breathing_issue"] = "sudden"
             self.info["category"] = "respiratory"
-        elif "lying" in all_text and ("worse" in all_text or "flat" in all_text):
+        elif "lying" in hits and ("worse" in hits or "flat" in hits):
             self.info["breathing_issue"] = "orthopnea"
             self.info["category"] = "cardiac"
 
         # Analyze fever
-        if "fever" in all_text or "chill" in all_text:
+        if "fever" in hits or "chill" in hits:
             self.info["fever"] = True
-        elif "no fever" in all_text:
+        elif "no fever" in hits:
             self.info["fever"] = False
 
         # Analyze nausea/vomiting
-        if "nausea" in all_text or "vomit" in all_text:
+        if "nausea" in hits or "vomit" in hits:
             self.info["nausea"] = True
 
         # Analyze onset
-        if "sudden" in all_text or "suddenly" in all_text:
+        if "sudden" in hits or "suddenly" in hits:
             self.info["onset"] = "sudden"
-        elif "gradual" in all_text or "over days" in all_text:
+        elif "gradual" in hits or "over days" in hits:
             self.info["onset"] = "gradual"
 
         # Specific condition indicators
-        if "stiff neck" in all_text or "neck stiff" in all_text:
+        if "stiff neck" in hits or "neck stiff" in hits:
             self.info["category"] = "neurological"
-        if "droop" in all_text or "slur" in all_text or "one side" in all_text:
+        if "droop" in hits or "slur" in hits or "one side" in hits:
             self.info["category"] = "neurological"
-        if "lower right" in all_text or "right lower" in all_text:
+        if "lower right" in hits or "right lower" in hits:
             self.info["category"] = "gi"  # appendicitis
-        if "hives" in all_text or "swelling" in all_text:
+        if "hives" in hits or "swelling" in hits:
             self.info["category"] = "allergic"
-        if "thirst" in all_text and "urination" in all_text:
+        if "thirst" in hits and "urination" in hits:
             self.info["category"] = "metabolic"  # DKA
 
     def _generate_question(self) -> dict:
         """Generate the next clinical question based on chief complaint."""
         # Base questions depend on chief complaint type
-        questions = []
-
-        if "chest" in self.chief_complaint:
-            questions = [
-                "Can you describe the chest pain - is it sharp, dull, or like pressure?",
-                "Does the pain go anywhere else, like your arm, shoulder, or jaw?",
-                "Did the pain start suddenly or gradually?",
-                "Are you having any shortness of breath?",
-                "Have you been sweating more than usual?",
-                "Does the pain change when you breathe deeply?",
-                "Have you had any nausea or felt like vomiting?",
-                "Have you ever had similar pain before?",
-            ]
-        elif "breath" in self.chief_complaint or "breathing" in self.chief_complaint:
-            questions = [
-                "Did the breathing difficulty start suddenly or gradually?",
-                "Do you hear any wheezing when you breathe?",
-                "Is it harder to breathe when lying down?",
-                "Have you had any chest pain along with the breathing trouble?",
-                "Have you had any recent leg pain or swelling?",
-                "Do you have a cough? If so, is anything coming up?",
-                "Have you had any fever or chills?",
-                "Do you have a history of asthma or lung problems?",
-            ]
-        elif "head" in self.chief_complaint:
-            questions = [
-                "How would you describe the headache - throbbing, constant, or like pressure?",
-                "Is this the worst headache you've ever had?",
-                "Is your neck stiff or painful to move?",
-                "Are you sensitive to light?",
-                "Have you had any weakness or numbness on one side of your body?",
-                "Have you felt nauseous or vomited?",
-                "Have you had any changes in your vision?",
-                "Have you had any fever?",
-            ]
-        elif "belly" in self.chief_complaint or "abdomen" in self.chief_complaint or "stomach" in self.chief_complaint:
-            questions = [
-                "Can you point to exactly where the pain is worst?",
-                "Did the pain start somewhere else and then move?",
-                "Does eating make the pain better or worse?",
-                "Have you been able to have bowel movements?",
-                "Have you had any nausea or vomiting?",
-                "Have you noticed any fever?",
-                "Does the pain go to your back or shoulder?",
-                "Is the pain constant or does it come and go?",
-            ]
-        else:
-            # General questions for other presentations
-            questions = [
-                "Can you describe your main symptom in more detail?",
-                "When did this start?",
-                "Is it getting worse, better, or staying the same?",
-                "Have you had any fever or chills?",
-                "Have you had any nausea or vomiting?",
-                "Does anything make it better or worse?",
-                "Have you had anything like this before?",
-                "Do you have any other symptoms?",
-            ]
+        questions = _GENERAL_QUESTIONS
+        for keys, complaint_questions in _QUESTIONS_BY_COMPLAINT:
+            if any(k in self.chief_complaint for k in keys):
+                questions = complaint_questions
+                break
 
         # Add follow-up questions based on what we've learned
-        if self.info["category"] == "cardiac" and self.info["pain_radiation"] is None:
-            questions.insert(0, "Does the pain go to your arm, jaw, or back?")
-        if self.info["category"] == "respiratory" and self.info["breathing_issue"] is None:
-            questions.insert(0, "Do you notice any wheezing or unusual sounds when breathing?")
-        if self.info["category"] == "neurological":
-            questions.insert(0, "Have you noticed any weakness, numbness, or difficulty speaking?")
-
-        # Filter out questions we've already asked
-        asked = {qa.get("question", "").lower() for qa in self.qa_history}
-        available = [q for q in questions if q.lower() not in asked]
-
-        if available:
-            return {"action_type": "question", "text": available[0]}
-        else:
-            return {"action_type": "question", "text": "Do you have any other symptoms I should know about?"}
+        category = self.info["category"]
+        if category == "cardiac" and self.info["pain_radiation"] is None:
+            questions = _CARDIAC_FOLLOW_UP + questions
+        elif category == "respiratory" and self.info["breathing_issue"] is None:
+            questions = _RESPIRATORY_FOLLOW_UP + questions
+        elif category == "neurological":
+            questions = _NEUROLOGICAL_FOLLOW_UP + questions
+
+        # Ask the first question we haven't already asked
+        # (_analyze_history has already collected the lowered questions asked)
+        asked = self._asked
+        text = next((q for q, q_lower in questions if q_lower not in asked), _FALLBACK_QUESTION)
+        return {"action_type": "question", "text": text}
 
     def _decide_guess(self) -> dict:
         """Decide whether to guess and what diagnosis to guess."""
-        # Score different diagnoses based on evidence
-        scores = {
-            "heart attack": 0,
-            "heart failure": 0,
-            "pulmonary embolism": 0,
-            "pneumonia": 0,
-            "asthma exacerbation": 0,
-            "stroke": 0,
-            "appendicitis": 0,
-            "cholecystitis": 0,
-            "pancreatitis": 0,
-            "kidney stones": 0,
-            "meningitis": 0,
-            "migraine": 0,
-            "sepsis": 0,
-            "anaphylaxis": 0,
-        }
-
-        all_text = " ".join(
-            f"{qa.get('question', '')} {qa.get('answer', '')}".lower()
-            for qa in self.qa_history
-        )
-
-        # Heart attack indicators
-        if self.info["pain_type"] == "crushing":
-            scores["heart attack"] += 3
-        if self.info["pain_radiation"] == "arm_jaw":
-            scores["heart attack"] += 3
-        if "sweating" in all_text:
-            scores["heart attack"] += 2
-
-        # Heart failure indicators
-        if self.info["breathing_issue"] == "orthopnea":
-            scores["heart failure"] += 3
-        if "swelling" in all_text and ("leg" in all_text or "ankle" in all_text):
-            scores["heart failure"] += 2
-        if "gasping" in all_text and "night" in all_text:
-            scores["heart failure"] += 2
-
-        # PE indicators
-        if self.info["onset"] == "sudden" and "breath" in self.chief_complaint:
-            scores["pulmonary embolism"] += 2
-        if "leg" in all_text and ("pain" in all_text or "swell" in all_text):
-            scores["pulmonary embolism"] += 2
-        if self.info["pain_type"] == "sharp" and "breath" in all_text:
-            scores["pulmonary embolism"] += 2
-
-        # Pneumonia indicators
-        if self.info["fever"] and "cough" in all_text:
-            scores["pneumonia"] += 3
-        if "mucus" in all_text or "phlegm" in all_text:
-            scores["pneumonia"] += 2
-
-        # Asthma indicators
-        if self.info["breathing_issue"] == "wheezing":
-            scores["asthma exacerbation"] += 3
-
-        # Stroke indicators
-        if "droop" in all_text or "weak" in all_text or "numb" in all_text:
-            scores["stroke"] += 3
-        if "slur" in all_text or "speech" in all_text:
-            scores["stroke"] += 2
-
-        # Appendicitis indicators
-        if "lower right" in all_text or "right lower" in all_text:
-            scores["appendicitis"] += 3
-        if "belly button" in all_text or "moved" in all_text:
-            scores["appendicitis"] += 2
-
-        # Gallbladder indicators
-        if "upper right" in all_text or "right upper" in all_text:
-            scores["cholecystitis"] += 2
-        if "fatty" in all_text or "after eating" in all_text:
-            scores["cholecystitis"] += 2
-
-        # Pancreatitis indicators
-        if "upper" in all_text and "back" in all_text:
-            scores["pancreatitis"] += 2
-        if "lean" in all_text or "forward" in all_text:
-            scores["pancreatitis"] += 2
-
-        # Kidney stone indicators
-        if self.info["pain_radiation"] == "groin":
-            scores["kidney stones"] += 3
-        if "wave" in all_text or "comes and goes" in all_text:
-            scores["kidney stones"] += 2
-        if "flank" in all_text:
-            scores["kidney stones"] += 2
-
-        # Meningitis indicators
-        if "stiff" in all_text and "neck" in all_text:
-            scores["meningitis"] += 3
-        if "light" in all_text and "sensitiv" in all_text:
-            scores["meningitis"] += 2
-        if "worst headache" in all_text:
-            scores["meningitis"] += 2
-
-        # Migraine indicators
-        if "throbb" in all_text and "one side" in all_text:
-            scores["migraine"] += 3
-        if self.info["nausea"] and "head" in self.chief_complaint:
-            scores["migraine"] += 2
-
-        # Sepsis indicators
-        if "confus" in all_text:
-            scores["sepsis"] += 2
-        if self.info["fever"] and "very sick" in all_text:
-            scores["sepsis"] += 2
-
-        # Anaphylaxis indicators
-        if "hives" in all_text or "rash" in all_text:
-            scores["anaphylaxis"] += 2
-        if "throat" in all_text and "tight" in all_text:
-            scores["anaphylaxis"] += 3
+        # Facts the scoring rules can test, as a _FACT_BITS mask: keywords
+        # found by _analyze_history (which on_turn runs first) plus tokens
+        # derived from what we know; complaint facts are already folded into
+        # the specialized scorer
+        info = self.info
+        facts = self._hit_bits
+        if info["pain_type"]:
+            facts |= _FACT_BITS.get("pain_type=" + info["pain_type"], 0)
+        if info["pain_radiation"]:
+            facts |= _FACT_BITS.get("radiation=" + info["pain_radiation"], 0)
+        if info["breathing_issue"]:
+            facts |= _FACT_BITS.get("breathing=" + info["breathing_issue"], 0)
+        if info["onset"]:
+            facts |= _FACT_BITS.get("onset=" + info["onset"], 0)
+        if info["fever"]:
+            facts |= _FACT_BITS["has_fever"]
+        if info["nausea"]:
+            facts |= _FACT_BITS["has_nausea"]
 
         # Check vital signs for additional clues
-        hr = self.vital_signs.get("HR", "")
-        bp = self.vital_signs.get("BP", "")
-        spo2 = self.vital_signs.get("SpO2", "")
-        temp = self.vital_signs.get("Temp", "")
-
-        # High heart rate
-        if any(x in hr for x in ["120", "130", "125"]):
-            scores["heart attack"] += 1
-            scores["pulmonary embolism"] += 1
-            scores["sepsis"] += 1
-
-        # Low oxygen
-        if any(x in spo2 for x in ["88%", "89%", "90%", "91%"]):
-            scores["pulmonary embolism"] += 2
-            scores["pneumonia"] += 1
-            scores["asthma exacerbation"] += 1
-
-        # High fever
-        if any(x in temp for x in ["102", "103", "104"]):
-            scores["pneumonia"] += 2
-            scores["meningitis"] += 2
-            scores["sepsis"] += 2
+        if _HR_HIGH.search(self.vital_signs.get("HR", "")):
+            facts |= _FACT_BITS["vitals=high_hr"]
+        if _SPO2_LOW.search(self.vital_signs.get("SpO2", "")):
+            facts |= _FACT_BITS["vitals=low_spo2"]
+        if _TEMP_HIGH.search(self.vital_signs.get("Temp", "")):
+            facts |= _FACT_BITS["vitals=high_temp"]
+        if _BP_LOW.search(self.vital_signs.get("BP", "")):
+            facts |= _FACT_BITS["vitals=low_bp"]
+
+        # Every rule needs at least one fact beyond the chief complaint, so
+        # with none there is nothing to score and no diagnosis to commit to
+        if not facts:
+            return {"action_type": "pass"}
 
-        # Low blood pressure
-        if any(x in bp for x in ["80/", "85/", "90/"]):
-            scores["sepsis"] += 2
-            scores["anaphylaxis"] += 2
+        # Score different diagnoses based on evidence
+        scores = _scorer_for(self.chief_complaint)(facts)
 
         # Find best diagnosis
-        best_diagnosis = max(scores, key=scores.get)
-        best_score = scores[best_diagnosis]
+        best = 0
+        for i in range(1, len(scores)):
+            if scores[i] > scores[best]:
+                best = i
+        best_diagnosis = _DIAGNOSES[best]
+        best_score = scores[best]
 
         # Determine confidence and decision
-        known_facts = sum(1 for v in self.info.values() if v is not None)
-
         # Increase guess probability in later rounds
         if self.round <= 3:
             # Too early unless very confident
@@ -390,4 +607,10 @@ class Agent:
         self.qa_history = []
         self.vital_signs = {}
         self.chief_complaint = ""
-        self.info = {k: None for k in self.info}
+        self.info = _INFO_TEMPLATE.copy()
+        self._scanned_upto = 0
+        self._last_scanned = None
+        self._scan_tail = ""
+        self._hits = set()
+        self._hit_bits = 0
+        self._asked = set()
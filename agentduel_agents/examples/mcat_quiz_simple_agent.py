@@ -10,7 +10,108 @@ Usage:
     agentduel match --game mcat-quiz
 """
 
-import random
+import logging
+import re
+
+logger = logging.getLogger("agentduel.agent")
+
+# Common patterns in MCAT questions
+_KEYWORDS_BY_CATEGORY = {
+    "biology": (
+        ("mitochondria", "atp", "energy"),
+        ("dna", "rna", "transcription", "translation"),
+        ("cell", "membrane", "nucleus"),
+        ("enzyme", "protein", "catalyze"),
+    ),
+    "biochemistry": (
+        ("glycolysis", "glucose", "pyruvate"),
+        ("amino acid", "protein", "peptide"),
+        ("enzyme", "substrate", "inhibitor"),
+        ("atp", "nadh", "fadh2"),
+    ),
+    "chemistry": (
+        ("acid", "base", "ph", "pka"),
+        ("bond", "orbital", "hybridization"),
+        ("reaction", "mechanism", "stereochemistry"),
+        ("equilibrium", "rate", "kinetics"),
+    ),
+    "physics": (
+        ("force", "acceleration", "velocity"),
+        ("energy", "work", "power"),
+        ("wave", "frequency", "wavelength"),
+        ("electric", "magnetic", "circuit"),
+    ),
+    "psychology": (
+        ("behavior", "cognition", "memory"),
+        ("neurotransmitter", "dopamine", "serotonin"),
+        ("development", "stage", "piaget"),
+        ("conditioning", "reinforcement", "learning"),
+    ),
+    "sociology": (
+        ("society", "culture", "norm"),
+        ("group", "social", "interaction"),
+        ("status", "role", "institution"),
+        ("class", "inequality", "stratification"),
+    ),
+}
+
+
+def _compile_keywords(keywords: tuple) -> tuple:
+    """
+    Build a (pattern, prefixes) matcher that finds every keyword in one scan.
+
+    The lookahead lets matches overlap, and longest-first ordering reports the
+    longest keyword at each position; the shorter keywords it starts with
+    (e.g. "wave" in "wavelength") are added back from ``prefixes``.
+    """
+    ordered = sorted(keywords, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+    prefixes = {k: frozenset(p for p in keywords if k.startswith(p)) for k in keywords}
+    return pattern, prefixes
+
+
+def _count_keywords(matcher: tuple, text: str) -> int:
+    """Count how many distinct keywords of ``matcher`` occur in ``text``."""
+    pattern, prefixes = matcher
+    hits = set()
+    for match in set(pattern.findall(text)):
+        hits |= prefixes[match]
+    return len(hits)
+
+
+_CATEGORY_MATCHERS = {
+    category: _compile_keywords(tuple(k for group in groups for k in group))
+    for category, groups in _KEYWORDS_BY_CATEGORY.items()
+}
+
+# Answer letters, and the order ties between them are broken in
+_CHOICES = ("A", "B", "C", "D")
+_CHOICES_BY_PREFERENCE = ("B", "C", "A", "D")
+
+# Absolute terms (often wrong in MCQs) and qualifiers (often correct)
+_ABSOLUTE_RE = re.compile("always|never|all|none|only")
+_QUALIFIER_RE = re.compile("most|usually|often|can|may")
+
+
+def _score_options(
+    hit_counts: list, word_counts: list, absolute_flags: list, qualifier_flags: list
+) -> list:
+    """
+    Score answer options from precomputed features, one entry per option.
+
+    Works on plain numbers only, so a bulk evaluator can call it directly
+    on feature vectors without going through the string handling.
+    """
+    # Keyword matches, a bonus for longer, more specific answers, a penalty
+    # for absolute terms (often wrong in MCQs) and a bonus for qualifiers
+    # (often correct). Booleans scale the weights, so there are no branches;
+    # the terms are added in this order so tied scores stay exactly equal.
+    return [
+        hits + 0.5 * (5 <= words <= 15) - 0.5 * absolute + 0.3 * qualifier
+        for hits, words, absolute, qualifier in zip(
+            hit_counts, word_counts, absolute_flags, qualifier_flags
+        )
+    ]
 
 
 class Agent:
@@ -24,6 +125,8 @@ class Agent:
 
     GAME = "mcat-quiz"
 
+    __slots__ = ("round_number", "history", "score", "opponent_score")
+
     def __init__(self):
         self.round_number = 0
         self.history = []
@@ -32,14 +135,14 @@ class Agent:
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
-        print("MCAT Quiz match starting!")
-        print(f"Match format: {match_info.get('rounds_per_match', 5)} games")
+        logger.info("MCAT Quiz match starting!")
+        logger.info("Match format: %s games", match_info.get("rounds_per_match", 5))
 
     def on_round_start(self, round_info: dict) -> None:
         """Called at the start of each game within the match."""
         self.round_number = 0
         self.history = []
-        print(f"Starting game {round_info.get('round_number', 1)}")
+        logger.info("Starting game %s", round_info.get("round_number", 1))
 
     def on_turn(self, game_state: dict) -> dict:
         """
@@ -68,8 +171,8 @@ class Agent:
         # Use heuristics to pick an answer
         choice = self._analyze_question(question, options, category)
 
-        print(f"Q{self.round_number}: {question[:50]}...")
-        print(f"  Answering: {choice}")
+        logger.info("Q%s: %s...", self.round_number, question[:50])
+        logger.info("  Answering: %s", choice)
 
         return {"action_type": "answer", "choice": choice}
 
@@ -80,90 +183,36 @@ class Agent:
         This uses simple heuristics. For better performance, consider
         using an LLM to actually answer the questions.
         """
-        question_lower = question.lower()
-
         # Look for keyword matches in options
-        scores = {"A": 0, "B": 0, "C": 0, "D": 0}
-
-        # Common patterns in MCAT questions
-        keywords_by_category = {
-            "biology": [
-                ("mitochondria", "atp", "energy"),
-                ("dna", "rna", "transcription", "translation"),
-                ("cell", "membrane", "nucleus"),
-                ("enzyme", "protein", "catalyze"),
-            ],
-            "biochemistry": [
-                ("glycolysis", "glucose", "pyruvate"),
-                ("amino acid", "protein", "peptide"),
-                ("enzyme", "substrate", "inhibitor"),
-                ("atp", "nadh", "fadh2"),
-            ],
-            "chemistry": [
-                ("acid", "base", "ph", "pka"),
-                ("bond", "orbital", "hybridization"),
-                ("reaction", "mechanism", "stereochemistry"),
-                ("equilibrium", "rate", "kinetics"),
-            ],
-            "physics": [
-                ("force", "acceleration", "velocity"),
-                ("energy", "work", "power"),
-                ("wave", "frequency", "wavelength"),
-                ("electric", "magnetic", "circuit"),
-            ],
-            "psychology": [
-                ("behavior", "cognition", "memory"),
-                ("neurotransmitter", "dopamine", "serotonin"),
-                ("development", "stage", "piaget"),
-                ("conditioning", "reinforcement", "learning"),
-            ],
-            "sociology": [
-                ("society", "culture", "norm"),
-                ("group", "social", "interaction"),
-                ("status", "role", "institution"),
-                ("class", "inequality", "stratification"),
-            ],
-        }
-
-        # Score options based on keyword matches
-        relevant_keywords = keywords_by_category.get(category, [])
-        for letter, text in options.items():
+        scores = dict.fromkeys(_CHOICES, 0)
+
+        # Extract per-option features, then score them
+        matcher = _CATEGORY_MATCHERS.get(category)
+        hit_counts = []
+        word_counts = []
+        absolute_flags = []
+        qualifier_flags = []
+        for text in options.values():
             text_lower = text.lower()
-
-            # Check for keyword matches
-            for keyword_group in relevant_keywords:
-                for keyword in keyword_group:
-                    if keyword in text_lower:
-                        scores[letter] += 1
-
-            # Prefer longer, more specific answers
-            word_count = len(text.split())
-            if 5 <= word_count <= 15:
-                scores[letter] += 0.5
-
-            # Avoid absolute terms (often wrong in MCQs)
-            absolute_terms = ["always", "never", "all", "none", "only"]
-            if any(term in text_lower for term in absolute_terms):
-                scores[letter] -= 0.5
-
-            # Prefer answers with qualifiers (often correct)
-            qualifier_terms = ["most", "usually", "often", "can", "may"]
-            if any(term in text_lower for term in qualifier_terms):
-                scores[letter] += 0.3
-
-        # Find the highest scoring answer
-        max_score = max(scores.values())
-        best_choices = [k for k, v in scores.items() if v == max_score]
-
-        if len(best_choices) == 1:
-            return best_choices[0]
-
-        # If tied, use statistical bias (B and C are more often correct)
-        for preferred in ["B", "C", "A", "D"]:
-            if preferred in best_choices:
-                return preferred
-
-        return random.choice(list(options.keys()))
+            hit_counts.append(_count_keywords(matcher, text_lower) if matcher else 0)
+            word_counts.append(len(text_lower.split()))
+            absolute_flags.append(_ABSOLUTE_RE.search(text_lower) is not None)
+            qualifier_flags.append(_QUALIFIER_RE.search(text_lower) is not None)
+
+        scores.update(zip(
+            options,
+            _score_options(hit_counts, word_counts, absolute_flags, qualifier_flags),
+        ))
+
+        # Find the highest scoring answer; scanning in preference order means
+        # ties use statistical bias (B and C are more often correct)
+        best = _CHOICES_BY_PREFERENCE[0]
+        best_score = scores[best]
+        for choice in _CHOICES_BY_PREFERENCE[1:]:
+            if scores[choice] > best_score:
+                best = choice
+                best_score = scores[choice]
+        return best
 
     def on_round_end(self, result: dict) -> None:
         """Called when a game ends."""
@@ -178,8 +227,8 @@ class Agent:
         })
 
         if winner == "you":
-            print(f"  Game won! Final: {your_score}-{opponent_score}")
+            logger.info("  Game won! Final: %s-%s", your_score, opponent_score)
         elif winner == "opponent":
-            print(f"  Game lost. Final: {your_score}-{opponent_score}")
+            logger.info("  Game lost. Final: %s-%s", your_score, opponent_score)
         else:
-            print(f"  Game tied! Final: {your_score}-{opponent_score}")
+            logger.info("  Game tied! Final: %s-%s", your_score, opponent_score)
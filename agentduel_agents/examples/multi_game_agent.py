@@ -11,28 +11,39 @@ This agent does NOT have a GAME property, so it can participate in
 Run with: agentduel match --all --agent examples/multi_game_agent.py
 """
 
+import logging
+
+logger = logging.getLogger("agentduel.agent")
+
 
 class Agent:
     """A multi-game agent that can play all game types."""
 
     # No GAME property - this agent can play any game
 
+    __slots__ = ("round_number", "current_game_type", "all_game_rules", "_handlers")
+
     def __init__(self):
         self.round_number = 0
         self.current_game_type = None
         self.all_game_rules = {}
+        # game type -> handler; unknown types play Split or Steal
+        self._handlers = {
+            "liars-dice": self._handle_liars_dice,
+            "split-or-steal": self._handle_split_or_steal,
+        }
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
         rounds_per_match = match_info.get("rounds_per_match", 3)
         match_game_id = match_info.get("match_game_id", "all")
-        print(f"Match starting! Mode: {match_game_id}, {rounds_per_match} rounds to play.")
+        logger.info("Match starting! Mode: %s, %s rounds to play.", match_game_id, rounds_per_match)
 
         # For "all" mode, we get rules for all games
         if match_info.get("all_game_rules"):
             self.all_game_rules = match_info["all_game_rules"]
             game_sequence = match_info.get("game_sequence", [])
-            print(f"Game sequence: {', '.join(game_sequence)}")
+            logger.info("Game sequence: %s", ", ".join(game_sequence))
         else:
             # Single game mode - store the rules
             self.all_game_rules[match_info.get("game_id")] = {
@@ -46,7 +57,7 @@ class Agent:
         self.round_number = round_info.get("round_number", 1)
         # Detect game type from the game_id field
         self.current_game_type = round_info.get("game_id", "split-or-steal")
-        print(f"Round {self.round_number} starting: {self.current_game_type}")
+        logger.info("Round %s starting: %s", self.round_number, self.current_game_type)
 
     def on_turn(self, game_state: dict) -> dict:
         """
@@ -64,10 +75,8 @@ class Agent:
             else:
                 self.current_game_type = "split-or-steal"
 
-        if self.current_game_type == "liars-dice":
-            return self._handle_liars_dice(game_state, phase)
-        else:
-            return self._handle_split_or_steal(game_state, phase)
+        handler = self._handlers.get(self.current_game_type, self._handle_split_or_steal)
+        return handler(game_state, phase)
 
     def _handle_split_or_steal(self, game_state: dict, phase: str) -> dict:
         """Handle Split or Steal game logic."""
@@ -102,18 +111,20 @@ class Agent:
 
         if current_bid is None:
             # Opening bid - bid conservatively based on our dice
-            # Count non-wild dice by face value
+            # Count non-wild dice by face value, and wilds, in one pass
             counts = {}
+            wilds = 0
             for d in my_dice:
-                if d != 1:  # 1s are wild
+                if d == 1:  # 1s are wild
+                    wilds += 1
+                else:
                     counts[d] = counts.get(d, 0) + 1
 
             if counts:
-                # Bid our most common face value
-                best_face = max(counts.keys(), key=lambda f: counts[f])
+                # Bid our most common face value; ties go to the face rolled first
+                best_face = max(counts, key=counts.__getitem__)
                 best_count = counts[best_face]
                 # Add wilds
-                wilds = sum(1 for d in my_dice if d == 1)
                 quantity = min(best_count + wilds, total_dice)
                 return {
                     "action_type": "bid",
@@ -172,4 +183,4 @@ class Agent:
             outcome = "Draw"
 
         round_num = result.get("round_number")
-        print(f"  Round {round_num}: {outcome} ({game_id}) - {your_pts} vs {opp_pts}")
+        logger.info("  Round %s: %s (%s) - %s vs %s", round_num, outcome, game_id, your_pts, opp_pts)
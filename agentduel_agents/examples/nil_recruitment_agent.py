@@ -12,8 +12,40 @@ Usage:
     agentduel match --game nil-recruitment --agent examples/nil_recruitment_agent.py
 """
 
+import asyncio
+import logging
 import os
-from openai import OpenAI
+
+from agentduel_agents.openai_helpers import (
+    ResponseCache,
+    aread_stream,
+    get_async_client,
+    get_client,
+    read_stream,
+    request_key,
+    request_slots,
+)
+
+logger = logging.getLogger("agentduel.agent")
+
+# Pitches already generated for an identical request, shared by every Agent
+# in the process. Tournaments replay the same university and recruit
+# pairings, so opening pitches especially repeat.
+_PITCH_CACHE = ResponseCache(256)
+
+# Pitches are asked to stay under this many characters. Completions are
+# streamed and reading stops once a pitch passes the limit, instead of
+# waiting for the model to finish a reply that would be cut anyway.
+_MAX_PITCH_CHARS = 800
+
+
+def _trim_pitch(text: str) -> str:
+    """Cut an over-long streamed pitch at its last full sentence."""
+    if len(text) <= _MAX_PITCH_CHARS:
+        return text
+    text = text[:_MAX_PITCH_CHARS]
+    end = max(text.rfind("."), text.rfind("!"), text.rfind("?"))
+    return text[:end + 1] if end > 0 else text
 
 
 class Agent:
@@ -33,18 +65,26 @@ class Agent:
                 "OPENAI_API_KEY environment variable not set. "
                 "Set it with: export OPENAI_API_KEY='your-key-here'"
             )
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_client(api_key)
         self.university = None
         self.athlete = None
         self.opponent_university = None
         self.messages_history = []
         self.game_rules = None
+        # Derived from the round's university and athlete in on_round_start
+        self._system_message = None
+        self._first_name = None
+        self._fallbacks = None
+        self._speculative_intro = None
+        # Set once the runner awaits on_turn_async; until then nothing
+        # would read a speculative pitch, so none is started
+        self._async_turns = False
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
         self.game_rules = match_info.get("rules")
         rounds_per_match = match_info.get("rounds_per_match", 5)
-        print(f"NIL Recruitment match starting! {rounds_per_match} rounds to play.")
+        logger.info("NIL Recruitment match starting! %s rounds to play.", rounds_per_match)
         # Rules available in match_info["rules"] describe the game flow
         # input_spec and output_spec describe what to expect and return
 
@@ -56,35 +96,130 @@ class Agent:
         self.athlete = game_state.get("athlete_profile", {})
         self.messages_history = []
 
+        # None of these change during the round, so build them once
+        athlete_name = self.athlete.get("name", "")
+        self._first_name = (athlete_name.split() or [""])[0] if athlete_name else ""
+        try:
+            self._system_message = {"role": "system", "content": self._system_prompt()}
+        except Exception as e:
+            # Profile data the prompt can't render; this round's turns use
+            # the fallback pitches, as they would if the API call failed
+            self._system_message = None
+        self._fallbacks = self._build_fallbacks()
+
+        # Under an async runner, start the introduction pitch right away: its
+        # prompt only uses the round's facts, so the request is already known
+        # and its latency overlaps with the rest of the round setup
+        if not self._async_turns or self._system_message is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            _, request = self._prepare_turn({"phase": "introduction"})
+            self._speculative_intro = loop.create_task(
+                self._pitch_async("introduction", request)
+            )
+
     def on_turn(self, game_state: dict) -> dict:
         """Generate a recruiting pitch for the current turn."""
-        phase = game_state.get("phase", "introduction")
-        messages = game_state.get("messages", [])
+        phase, request = self._prepare_turn(game_state)
+        speculative = self._speculative_intro
+        if speculative is not None:
+            self._speculative_intro = None
+            # Waiting on the task here would block the loop it runs on, so
+            # it's only used if it has already finished
+            if phase == "introduction" and speculative.done() and not speculative.cancelled():
+                return speculative.result()
+            speculative.cancel()
+
+        if self._system_message is None:
+            return {"action_type": "pitch", "text": self._fallback_pitch(phase)}
+
+        key = request_key(request)
+        pitch_text = _PITCH_CACHE.get(key)
+        if pitch_text is not None:
+            return {"action_type": "pitch", "text": pitch_text}
 
-        # Store message history for context
-        self.messages_history = messages
+        try:
+            stream = self.client.chat.completions.create(**request, stream=True)
+            pitch_text = _trim_pitch(read_stream(stream, _MAX_PITCH_CHARS))
+            if pitch_text:
+                _PITCH_CACHE.remember(key, pitch_text)
+            else:
+                pitch_text = self._fallback_pitch(phase)
+        except Exception as e:
+            # Fallback if API call fails
+            pitch_text = self._fallback_pitch(phase)
 
-        # Build prompt based on phase
-        prompt = self._build_prompt(phase, messages)
+        return {"action_type": "pitch", "text": pitch_text}
+
+    async def on_turn_async(self, game_state: dict) -> dict:
+        """
+        Async version of on_turn.
+
+        A runner that drives several matches from one event loop can await
+        this instead, so their API calls overlap rather than each turn
+        blocking the process until its completion returns.
+        """
+        self._async_turns = True
+        phase, request = self._prepare_turn(game_state)
+        speculative = self._speculative_intro
+        if speculative is not None:
+            self._speculative_intro = None
+            if phase == "introduction":
+                return await speculative
+            speculative.cancel()
+        return await self._pitch_async(phase, request)
+
+    async def _pitch_async(self, phase: str, request: dict) -> dict:
+        """Generate the pitch for a prepared request without blocking the loop."""
+        if self._system_message is None:
+            return {"action_type": "pitch", "text": self._fallback_pitch(phase)}
+
+        key = request_key(request)
+        pitch_text = _PITCH_CACHE.get(key)
+        if pitch_text is not None:
+            return {"action_type": "pitch", "text": pitch_text}
+
+        client = get_async_client(self.client.api_key)
 
-        # Generate pitch using GPT-4o-mini
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": self._system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=800,
-                temperature=0.8,
-            )
-            pitch_text = response.choices[0].message.content
+            async with request_slots():
+                stream = await client.chat.completions.create(**request, stream=True)
+                pitch_text = _trim_pitch(await aread_stream(stream, _MAX_PITCH_CHARS))
+            if pitch_text:
+                _PITCH_CACHE.remember(key, pitch_text)
+            else:
+                pitch_text = self._fallback_pitch(phase)
         except Exception as e:
             # Fallback if API call fails
             pitch_text = self._fallback_pitch(phase)
 
         return {"action_type": "pitch", "text": pitch_text}
 
+    def _prepare_turn(self, game_state: dict) -> tuple:
+        """Return the turn's phase and the chat completion request for it."""
+        phase = game_state.get("phase", "introduction")
+        messages = game_state.get("messages", [])
+
+        # Store message history for context
+        self.messages_history = messages
+
+        # Build prompt based on phase
+        prompt = self._build_prompt(phase, messages)
+
+        return phase, {
+            "model": "gpt-4o-mini",
+            "messages": [
+                self._system_message,
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 800,
+            "temperature": 0.8,
+        }
+
     def _system_prompt(self) -> str:
         """Build the system prompt for the recruiting agent."""
         uni_name = self.university.get("full_name", self.university.get("name", "our university"))
@@ -143,20 +278,20 @@ Remember: This recruit has many options. You need to show why YOUR program is th
     def _build_prompt(self, phase: str, messages: list) -> str:
         """Build the user prompt based on phase and conversation history."""
         # Format conversation history
-        conversation = ""
-        if messages:
-            for msg in messages:
-                author = msg.get("author", "unknown")
-                text = msg.get("text", "")
-                if author == "you":
-                    conversation += f"You said: {text}\n\n"
-                elif author == "opponent":
-                    conversation += f"Opposing recruiter said: {text}\n\n"
-                else:  # athlete
-                    conversation += f"Athlete said: {text}\n\n"
+        parts = []
+        for msg in messages:
+            author = msg.get("author", "unknown")
+            text = msg.get("text", "")
+            if author == "you":
+                parts.append(f"You said: {text}\n\n")
+            elif author == "opponent":
+                parts.append(f"Opposing recruiter said: {text}\n\n")
+            else:  # athlete
+                parts.append(f"Athlete said: {text}\n\n")
+        conversation = "".join(parts)
 
         athlete_name = self.athlete.get("name", "the recruit")
-        first_name = athlete_name.split()[0] if athlete_name else "them"
+        first_name = self._first_name or "them"
 
         if phase == "introduction":
             return f"""This is your introduction. Make a strong first impression on {athlete_name}.
@@ -193,18 +328,21 @@ Based on what's been said:
 
 Remember to be genuine and specific, not generic."""
 
-    def _fallback_pitch(self, phase: str) -> str:
-        """Fallback pitch if API call fails."""
+    def _build_fallbacks(self) -> dict:
+        """Fallback pitch if API call fails, by phase; any other phase uses "persuasion"."""
         uni_name = self.university.get("name", "our university")
-        athlete_name = self.athlete.get("name", "")
-        first_name = athlete_name.split()[0] if athlete_name else "friend"
+        first_name = self._first_name or "friend"
 
-        if phase == "introduction":
-            return f"{first_name}, I'm honored to represent {uni_name}. We've been watching your tape and we believe you have what it takes to be special here. Let me tell you why."
-        elif phase == "closing":
-            return f"{first_name}, at the end of the day, this decision is about your future. At {uni_name}, we're committed to helping you achieve your dreams both on and off the field. We want you in our family."
-        else:
-            return f"{first_name}, I hear your concerns and I want to address them directly. At {uni_name}, we put our players first. Let me explain how we'd support your development."
+        return {
+            "introduction": f"{first_name}, I'm honored to represent {uni_name}. We've been watching your tape and we believe you have what it takes to be special here. Let me tell you why.",
+            "closing": f"{first_name}, at the end of the day, this decision is about your future. At {uni_name}, we're committed to helping you achieve your dreams both on and off the field. We want you in our family.",
+            "persuasion": f"{first_name}, I hear your concerns and I want to address them directly. At {uni_name}, we put our players first. Let me explain how we'd support your development.",
+        }
+
+    def _fallback_pitch(self, phase: str) -> str:
+        """Fallback pitch if API call fails."""
+        fallbacks = self._fallbacks
+        return fallbacks.get(phase) or fallbacks["persuasion"]
 
     def on_round_end(self, result: dict) -> None:
         """Called when a round ends."""
@@ -213,3 +351,9 @@ Remember to be genuine and specific, not generic."""
         self.athlete = None
         self.opponent_university = None
         self.messages_history = []
+        self._system_message = None
+        self._first_name = None
+        self._fallbacks = None
+        if self._speculative_intro is not None:
+            self._speculative_intro.cancel()
+            self._speculative_intro = None
@@ -12,8 +12,40 @@ Usage:
     agentduel match --game nil-recruitment --agent examples/nil_recruitment_agent_v2.py
 """
 
+import asyncio
+import logging
 import os
-from openai import OpenAI
+
+from agentduel_agents.openai_helpers import (
+    ResponseCache,
+    aread_stream,
+    get_async_client,
+    get_client,
+    read_stream,
+    request_key,
+    request_slots,
+)
+
+logger = logging.getLogger("agentduel.agent")
+
+# Pitches already generated for an identical request, shared by every Agent
+# in the process. Tournaments replay the same university and recruit
+# pairings, so opening pitches especially repeat.
+_PITCH_CACHE = ResponseCache(256)
+
+# Pitches are asked to stay under this many characters. Completions are
+# streamed and reading stops once a pitch passes the limit, instead of
+# waiting for the model to finish a reply that would be cut anyway.
+_MAX_PITCH_CHARS = 800
+
+
+def _trim_pitch(text: str) -> str:
+    """Cut an over-long streamed pitch at its last full sentence."""
+    if len(text) <= _MAX_PITCH_CHARS:
+        return text
+    text = text[:_MAX_PITCH_CHARS]
+    end = max(text.rfind("."), text.rfind("!"), text.rfind("?"))
+    return text[:end + 1] if end > 0 else text
 
 
 class Agent:
@@ -32,16 +64,24 @@ class Agent:
                 "OPENAI_API_KEY environment variable not set. "
                 "Set it with: export OPENAI_API_KEY='your-key-here'"
             )
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_client(api_key)
         self.university = None
         self.athlete = None
         self.opponent_university = None
         self.round_number = 0
+        # Derived from the round's university and athlete in on_round_start
+        self._system_message = None
+        self._first_name = None
+        self._fallbacks = None
+        self._speculative_intro = None
+        # Set once the runner awaits on_turn_async; until then nothing
+        # would read a speculative pitch, so none is started
+        self._async_turns = False
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
         rounds_per_match = match_info.get("rounds_per_match", 5)
-        print(f"NIL Recruitment match starting! {rounds_per_match} rounds to play.")
+        logger.info("NIL Recruitment match starting! %s rounds to play.", rounds_per_match)
         # Game rules available in match_info["rules"]
         # Input/output specs in match_info["input_spec"] and match_info["output_spec"]
 
@@ -53,29 +93,126 @@ class Agent:
         self.athlete = game_state.get("athlete_profile", {})
         self.round_number = round_info.get("round_number", 1)
 
+        # None of these change during the round, so build them once
+        athlete_name = self.athlete.get("name", "")
+        self._first_name = (athlete_name.split() or [""])[0] if athlete_name else ""
+        try:
+            self._system_message = {"role": "system", "content": self._system_prompt()}
+        except Exception as e:
+            # Profile data the prompt can't render; this round's turns use
+            # the fallback pitches, as they would if the API call failed
+            self._system_message = None
+        self._fallbacks = self._build_fallbacks()
+
+        # Under an async runner, start the introduction pitch right away: its
+        # prompt only uses the round's facts, so the request is already known
+        # and its latency overlaps with the rest of the round setup
+        if not self._async_turns or self._system_message is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            _, request = self._prepare_turn({"phase": "introduction"})
+            self._speculative_intro = loop.create_task(
+                self._pitch_async("introduction", request)
+            )
+
     def on_turn(self, game_state: dict) -> dict:
         """Generate an aggressive recruiting pitch."""
-        phase = game_state.get("phase", "introduction")
-        messages = game_state.get("messages", [])
+        phase, request = self._prepare_turn(game_state)
+        speculative = self._speculative_intro
+        if speculative is not None:
+            self._speculative_intro = None
+            # Waiting on the task here would block the loop it runs on, so
+            # it's only used if it has already finished
+            if phase == "introduction" and speculative.done() and not speculative.cancelled():
+                return speculative.result()
+            speculative.cancel()
+
+        if self._system_message is None:
+            return {"action_type": "pitch", "text": self._fallback_pitch(phase)}
+
+        key = request_key(request)
+        pitch_text = _PITCH_CACHE.get(key)
+        if pitch_text is not None:
+            return {"action_type": "pitch", "text": pitch_text}
 
-        prompt = self._build_prompt(phase, messages)
+        try:
+            stream = self.client.chat.completions.create(**request, stream=True)
+            pitch_text = _trim_pitch(read_stream(stream, _MAX_PITCH_CHARS))
+            if pitch_text:
+                _PITCH_CACHE.remember(key, pitch_text)
+            else:
+                pitch_text = self._fallback_pitch(phase)
+        except Exception as e:
+            # Fallback if API call fails
+            pitch_text = self._fallback_pitch(phase)
+
+        return {"action_type": "pitch", "text": pitch_text}
+
+    async def on_turn_async(self, game_state: dict) -> dict:
+        """
+        Async version of on_turn.
+
+        A runner that drives several matches from one event loop can await
+        this instead, so their API calls overlap rather than each turn
+        blocking the process until its completion returns.
+        """
+        self._async_turns = True
+        phase, request = self._prepare_turn(game_state)
+        speculative = self._speculative_intro
+        if speculative is not None:
+            self._speculative_intro = None
+            if phase == "introduction":
+                return await speculative
+            speculative.cancel()
+        return await self._pitch_async(phase, request)
+
+    async def _pitch_async(self, phase: str, request: dict) -> dict:
+        """Generate the pitch for a prepared request without blocking the loop."""
+        if self._system_message is None:
+            return {"action_type": "pitch", "text": self._fallback_pitch(phase)}
+
+        key = request_key(request)
+        pitch_text = _PITCH_CACHE.get(key)
+        if pitch_text is not None:
+            return {"action_type": "pitch", "text": pitch_text}
+
+        client = get_async_client(self.client.api_key)
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": self._system_prompt()},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=800,
-                temperature=0.9,  # Higher temperature for bolder responses
-            )
-            pitch_text = response.choices[0].message.content
+            async with request_slots():
+                stream = await client.chat.completions.create(**request, stream=True)
+                pitch_text = _trim_pitch(await aread_stream(stream, _MAX_PITCH_CHARS))
+            if pitch_text:
+                _PITCH_CACHE.remember(key, pitch_text)
+            else:
+                pitch_text = self._fallback_pitch(phase)
         except Exception as e:
+            # Fallback if API call fails
             pitch_text = self._fallback_pitch(phase)
 
         return {"action_type": "pitch", "text": pitch_text}
 
+    def _prepare_turn(self, game_state: dict) -> tuple:
+        """Return the turn's phase and the chat completion request for it."""
+        phase = game_state.get("phase", "introduction")
+        messages = game_state.get("messages", [])
+
+        prompt = self._build_prompt(phase, messages)
+
+        return phase, {
+            "model": "gpt-4o-mini",
+            "messages": [
+                self._system_message,
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 800,
+            "temperature": 0.9,  # Higher temperature for bolder responses
+        }
+
     def _system_prompt(self) -> str:
         """Build aggressive system prompt."""
         uni_name = self.university.get("full_name", self.university.get("name", "our university"))
@@ -122,9 +259,7 @@ Keep responses under 800 characters. Be memorable."""
 
     def _build_prompt(self, phase: str, messages: list) -> str:
         """Build prompts for aggressive recruiting."""
-        conversation = self._format_conversation(messages)
         athlete_name = self.athlete.get("name", "the recruit")
-        first_name = athlete_name.split()[0] if athlete_name else "champ"
 
         if phase == "introduction":
             return f"""Make a BOLD first impression on {athlete_name}.
@@ -133,7 +268,9 @@ Don't just introduce yourself - make a statement. Why is your program THE destin
 
 Establish dominance early. The best programs recruit with confidence."""
 
-        elif phase == "closing":
+        conversation, opponent_points, athlete_concerns = self._scan_messages(messages)
+
+        if phase == "closing":
             return f"""CLOSING ARGUMENT - Time to close the deal with {athlete_name}.
 
 Conversation so far:
@@ -148,15 +285,6 @@ This is it. Make your final case with:
 Don't beg - challenge them to step up to the opportunity."""
 
         else:
-            # Analyze opponent's last message if available
-            opponent_points = ""
-            athlete_concerns = ""
-            for msg in reversed(messages):
-                if msg.get("author") == "opponent" and not opponent_points:
-                    opponent_points = msg.get("text", "")[:200]
-                if msg.get("author") == "athlete" and not athlete_concerns:
-                    athlete_concerns = msg.get("text", "")[:200]
-
             return f"""Continue your aggressive pitch to {athlete_name}.
 
 Previous conversation:
@@ -171,38 +299,58 @@ Your mission:
 3. Keep pushing your competitive advantages
 4. Maintain the energy - don't let up"""
 
-    def _format_conversation(self, messages: list) -> str:
-        """Format conversation history."""
+    def _scan_messages(self, messages: list) -> tuple:
+        """
+        Walk the conversation once.
+
+        Returns the formatted history plus the latest non-empty opponent and
+        athlete messages (first 200 characters each, "" if there are none).
+        """
         if not messages:
-            return "(No previous messages)"
+            return "(No previous messages)", "", ""
 
-        result = ""
+        result = []
+        opponent_points = ""
+        athlete_concerns = ""
         for msg in messages:
             author = msg.get("author", "unknown")
             text = msg.get("text", "")
             if author == "you":
-                result += f"YOU: {text}\n\n"
+                result.append(f"YOU: {text}\n\n")
             elif author == "opponent":
-                result += f"OPPONENT: {text}\n\n"
+                result.append(f"OPPONENT: {text}\n\n")
+                if text:
+                    opponent_points = text[:200]
             else:
-                result += f"ATHLETE: {text}\n\n"
-        return result
+                result.append(f"ATHLETE: {text}\n\n")
+                if author == "athlete" and text:
+                    athlete_concerns = text[:200]
+        return "".join(result), opponent_points, athlete_concerns
 
-    def _fallback_pitch(self, phase: str) -> str:
-        """Aggressive fallback pitches."""
+    def _build_fallbacks(self) -> dict:
+        """Aggressive fallback pitches, by phase; any other phase uses "persuasion"."""
         uni_name = self.university.get("name", "our program")
-        athlete_name = self.athlete.get("name", "")
-        first_name = athlete_name.split()[0] if athlete_name else "champ"
+        first_name = self._first_name or "champ"
 
-        if phase == "introduction":
-            return f"{first_name}, let's cut to the chase. {uni_name} doesn't recruit just anyone - we recruit future pros. You've got that potential. The question is: are you ready for the challenge?"
-        elif phase == "closing":
-            return f"{first_name}, this decision comes down to one thing: do you want to be good, or do you want to be great? At {uni_name}, we produce greatness. The ball's in your court."
-        else:
-            return f"Look {first_name}, I'm not here to tell you what you want to hear. I'm here to tell you the truth: {uni_name} will push you harder than anywhere else. That's how we develop NFL talent."
+        return {
+            "introduction": f"{first_name}, let's cut to the chase. {uni_name} doesn't recruit just anyone - we recruit future pros. You've got that potential. The question is: are you ready for the challenge?",
+            "closing": f"{first_name}, this decision comes down to one thing: do you want to be good, or do you want to be great? At {uni_name}, we produce greatness. The ball's in your court.",
+            "persuasion": f"Look {first_name}, I'm not here to tell you what you want to hear. I'm here to tell you the truth: {uni_name} will push you harder than anywhere else. That's how we develop NFL talent.",
+        }
+
+    def _fallback_pitch(self, phase: str) -> str:
+        """Aggressive fallback pitches."""
+        fallbacks = self._fallbacks
+        return fallbacks.get(phase) or fallbacks["persuasion"]
 
     def on_round_end(self, result: dict) -> None:
         """Reset for next round."""
         self.university = None
         self.athlete = None
         self.opponent_university = None
+        self._system_message = None
+        self._first_name = None
+        self._fallbacks = None
+        if self._speculative_intro is not None:
+            self._speculative_intro.cancel()
+            self._speculative_intro = None
@@ -10,6 +10,92 @@ Usage:
     agentduel match --game nil-recruitment
 """
 
+import logging
+from types import SimpleNamespace
+
+logger = logging.getLogger("agentduel.agent")
+
+
+def _nfl_pitch(nfl_alumni: list, championships: int) -> str:
+    """Pitch for a recruit whose top priority is reaching the NFL."""
+    if nfl_alumni:
+        alumni_names = ", ".join(nfl_alumni[:2])
+        return (
+            f"You want to reach the NFL? Look at {alumni_names} - "
+            f"they walked these same halls. Our development program is elite."
+        )
+    return (
+        "Our track record of developing NFL talent speaks for itself. "
+        "We know how to prepare players for the next level."
+    )
+
+
+def _academic_pitch(nfl_alumni: list, championships: int) -> str:
+    """Pitch for a recruit whose top priority is academics."""
+    return (
+        "Our academic support is world-class. You'll graduate "
+        "with a degree that matters, while competing at the highest level."
+    )
+
+
+def _nil_pitch(nfl_alumni: list, championships: int) -> str:
+    """Pitch for a recruit whose top priority is NIL money."""
+    return (
+        "Our NIL collective is one of the strongest in college football. "
+        "We'll make sure you're taken care of financially."
+    )
+
+
+def _championship_pitch(nfl_alumni: list, championships: int) -> str:
+    """Pitch for a recruit whose top priority is winning titles."""
+    if championships > 0:
+        return (
+            f"We've won {championships} national championships. "
+            f"We compete for titles every year. That's the standard here."
+        )
+    return (
+        "We're building something special here. "
+        "You could be part of our championship run."
+    )
+
+
+# (keywords, value) tables matched against a lowercased priority or concern,
+# checked in order; the first entry with any keyword in the text wins
+_PRIORITY_PITCHES = (
+    (("nfl", "draft"), _nfl_pitch),
+    (("academic",), _academic_pitch),
+    (("nil", "money"), _nil_pitch),
+    (("championship", "win"), _championship_pitch),
+)
+_CONCERN_PITCHES = (
+    (("playing time",), (
+        "I know you're thinking about playing time. "
+        "With your talent, you'll compete immediately."
+    )),
+    (("distance", "home"), (
+        "Being away from home is tough, but our program is like family. "
+        "You'll never feel alone here."
+    )),
+    (("coaching", "scheme"), (
+        "Our coaching staff is dedicated to maximizing your potential. "
+        "They've developed countless stars."
+    )),
+)
+_CLOSING_PRIORITY_TEXT = (
+    (("nfl",), "We've sent countless players to the NFL, and you could be next. "),
+    (("academic",), "Our academic programs will set you up for life beyond football. "),
+    (("nil", "money"), "Our NIL program is among the best in the nation. "),
+)
+
+
+def _match(text: str, table: tuple):
+    """Return the value of the first ``table`` entry matching ``text``, or None."""
+    for keywords, value in table:
+        for keyword in keywords:
+            if keyword in text:
+                return value
+    return None
+
 
 class Agent:
     """
@@ -26,11 +112,13 @@ class Agent:
         self.athlete = None
         self.opponent_university = None
         self.pitch_count = 0
+        # Round facts with defaults applied, resolved in on_round_start
+        self._profile = None
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
         rounds_per_match = match_info.get("rounds_per_match", 5)
-        print(f"NIL Recruitment match starting! {rounds_per_match} rounds to play.")
+        logger.info("NIL Recruitment match starting! %s rounds to play.", rounds_per_match)
         # Game rules available in match_info["rules"]
 
     def on_round_start(self, round_info: dict) -> None:
@@ -41,6 +129,23 @@ class Agent:
         self.athlete = game_state.get("athlete_profile", {})
         self.pitch_count = 0
 
+        # None of these change during the round, so look them up once
+        athlete = self.athlete.get
+        university = self.university.get
+        athlete_name = athlete("name", "friend")
+        self._profile = SimpleNamespace(
+            first_name=(athlete_name.split() or ["friend"])[0] if athlete_name else "friend",
+            position=athlete("position", "player"),
+            # Lowercased for keyword matching; "" when none were given
+            top_priority=(athlete("priorities") or [""])[0].lower(),
+            top_concern=(athlete("concerns") or [""])[0].lower(),
+            uni_name=university("full_name", university("name", "our university")),
+            nickname=university("nickname", "our team"),
+            conference=university("conference", "our conference"),
+            championships=university("national_championships", 0),
+            nfl_alumni=university("notable_nfl_alumni", []),
+        )
+
     def on_turn(self, game_state: dict) -> dict:
         """Generate a recruiting pitch for the current turn."""
         self.pitch_count += 1
@@ -48,27 +153,17 @@ class Agent:
         messages = game_state.get("messages", [])
 
         # Get athlete and university info
-        athlete_name = self.athlete.get("name", "friend")
-        first_name = athlete_name.split()[0] if athlete_name else "friend"
-        position = self.athlete.get("position", "player")
-        priorities = self.athlete.get("priorities", [])
-        concerns = self.athlete.get("concerns", [])
-
-        uni_name = self.university.get("full_name", self.university.get("name", "our university"))
-        nickname = self.university.get("nickname", "our team")
-        conference = self.university.get("conference", "our conference")
-        championships = self.university.get("national_championships", 0)
-        nfl_alumni = self.university.get("notable_nfl_alumni", [])
+        p = self._profile
 
         # Generate pitch based on phase
         if phase == "introduction":
-            pitch = self._intro_pitch(first_name, position, uni_name, nickname, conference)
+            pitch = self._intro_pitch(p.first_name, p.position, p.uni_name, p.nickname, p.conference)
         elif phase == "closing":
-            pitch = self._closing_pitch(first_name, uni_name, nickname, priorities)
+            pitch = self._closing_pitch(p.first_name, p.uni_name, p.nickname, p.top_priority)
         else:
             pitch = self._persuasion_pitch(
-                first_name, position, uni_name, nickname,
-                championships, nfl_alumni, priorities, concerns, messages
+                p.first_name, p.position, p.uni_name, p.nickname,
+                p.championships, p.nfl_alumni, p.top_priority, p.top_concern, messages
             )
 
         return {"action_type": "pitch", "text": pitch}
@@ -83,17 +178,9 @@ class Agent:
             f"Let me tell you why this is the place where your dreams become reality."
         )
 
-    def _closing_pitch(self, name, uni_name, nickname, priorities):
+    def _closing_pitch(self, name, uni_name, nickname, top_priority):
         """Generate a closing argument."""
-        priority_text = ""
-        if priorities:
-            top_priority = priorities[0]
-            if "nfl" in top_priority.lower():
-                priority_text = "We've sent countless players to the NFL, and you could be next. "
-            elif "academic" in top_priority.lower():
-                priority_text = "Our academic programs will set you up for life beyond football. "
-            elif "nil" in top_priority.lower() or "money" in top_priority.lower():
-                priority_text = "Our NIL program is among the best in the nation. "
+        priority_text = _match(top_priority, _CLOSING_PRIORITY_TEXT) or ""
 
         return (
             f"{name}, at the end of the day, this decision shapes your future. "
@@ -104,65 +191,19 @@ class Agent:
         )
 
     def _persuasion_pitch(self, name, position, uni_name, nickname,
-                         championships, nfl_alumni, priorities, concerns, messages):
+                         championships, nfl_alumni, top_priority, top_concern, messages):
         """Generate a persuasion round pitch."""
         parts = [f"{name}, let me address what matters most to you."]
 
         # Address top priority
-        if priorities:
-            top = priorities[0].lower()
-            if "nfl" in top or "draft" in top:
-                if nfl_alumni:
-                    alumni_names = ", ".join(nfl_alumni[:2])
-                    parts.append(
-                        f"You want to reach the NFL? Look at {alumni_names} - "
-                        f"they walked these same halls. Our development program is elite."
-                    )
-                else:
-                    parts.append(
-                        "Our track record of developing NFL talent speaks for itself. "
-                        "We know how to prepare players for the next level."
-                    )
-            elif "academic" in top:
-                parts.append(
-                    "Our academic support is world-class. You'll graduate "
-                    "with a degree that matters, while competing at the highest level."
-                )
-            elif "nil" in top or "money" in top:
-                parts.append(
-                    "Our NIL collective is one of the strongest in college football. "
-                    "We'll make sure you're taken care of financially."
-                )
-            elif "championship" in top or "win" in top:
-                if championships > 0:
-                    parts.append(
-                        f"We've won {championships} national championships. "
-                        f"We compete for titles every year. That's the standard here."
-                    )
-                else:
-                    parts.append(
-                        "We're building something special here. "
-                        "You could be part of our championship run."
-                    )
+        pitch = _match(top_priority, _PRIORITY_PITCHES)
+        if pitch is not None:
+            parts.append(pitch(nfl_alumni, championships))
 
         # Address a concern
-        if concerns:
-            concern = concerns[0].lower()
-            if "playing time" in concern:
-                parts.append(
-                    "I know you're thinking about playing time. "
-                    "With your talent, you'll compete immediately."
-                )
-            elif "distance" in concern or "home" in concern:
-                parts.append(
-                    "Being away from home is tough, but our program is like family. "
-                    "You'll never feel alone here."
-                )
-            elif "coaching" in concern or "scheme" in concern:
-                parts.append(
-                    "Our coaching staff is dedicated to maximizing your potential. "
-                    "They've developed countless stars."
-                )
+        text = _match(top_concern, _CONCERN_PITCHES)
+        if text is not None:
+            parts.append(text)
 
         return " ".join(parts)
 
@@ -172,3 +213,4 @@ class Agent:
         self.athlete = None
         self.opponent_university = None
         self.pitch_count = 0
+        self._profile = None
@@ -13,8 +13,79 @@ Requirements:
     pip install openai
 """
 
+import json
+import logging
 import os
-from openai import OpenAI
+import time
+
+from agentduel_agents.openai_helpers import (
+    ResponseCache,
+    aread_stream,
+    get_async_client,
+    get_client,
+    read_stream,
+    request_key,
+    request_slots,
+    single_flight,
+    wait_for_budget,
+)
+
+logger = logging.getLogger("agentduel.agent")
+
+# Arguments already generated for an identical request, shared by every
+# Agent in the process. Self-play and tournaments replay the same scenarios
+# and Presidents, so opening arguments especially repeat.
+_ARGUMENT_CACHE = ResponseCache(512)
+
+# Arguments longer than this get cut. Completions are streamed and reading
+# stops once the argument has passed the limit, instead of waiting for the
+# model to finish text that would be cut anyway.
+_MAX_ARGUMENT_CHARS = 950
+
+
+def _cap_argument(argument: str) -> str:
+    """Strip an argument and cut it to the game's length limit."""
+    argument = argument.strip()
+
+    # Ensure it's not too long
+    if len(argument) > _MAX_ARGUMENT_CHARS:
+        argument = argument[:_MAX_ARGUMENT_CHARS - 3] + "..."
+
+    return argument
+
+
+def _finish_argument(text: str) -> str:
+    """Return the capped argument from a streamed completion's text."""
+    argument = _cap_argument(text)
+    if not argument:
+        raise ValueError("completion returned no text")
+    return argument
+
+
+# Earlier messages sent as context: the newest ones, at most this many and
+# no more than fit in roughly 2,000 tokens, estimated at four characters a
+# token. A few long speeches can't then swell the prompt and its cost.
+_CONTEXT_MESSAGES = 6
+_CONTEXT_CHARS = 8000
+
+
+def _recent_messages(messages: list) -> list:
+    """Return the newest messages that fit the context limits, oldest first."""
+    recent = []
+    total = 0
+    for msg in reversed(messages[-_CONTEXT_MESSAGES:]):
+        total += len(msg.get("text") or "")
+        # The latest message always goes in, however long it is
+        if total > _CONTEXT_CHARS and recent:
+            break
+        recent.append(msg)
+    recent.reverse()
+    return recent
+
+
+# Returned when it isn't our turn, as a shared singleton - callers must not
+# mutate it
+_NO_ARGUMENT = {"action_type": "argument", "text": ""}
 
 
 class Agent:
@@ -22,6 +93,10 @@ class Agent:
 
     GAME = "nuclear-war"
 
+    # Our position and the label for the opposing advisor, by role
+    _PRO_ROLE_STRINGS = ("arguing FOR authorizing a nuclear strike", "Advisor arguing AGAINST")
+    _ANTI_ROLE_STRINGS = ("arguing AGAINST authorizing a nuclear strike", "Advisor arguing FOR")
+
     def __init__(self):
         api_key = os.environ.get("OPENAI_API_KEY")
         if not api_key:
@@ -29,7 +104,7 @@ class Agent:
                 "OPENAI_API_KEY environment variable is required. "
                 "Set it with: export OPENAI_API_KEY='your-key-here'"
             )
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_client(api_key)
         self.model = "gpt-4o-mini"
 
         # Game state
@@ -38,6 +113,10 @@ class Agent:
         self.country = None
         self.president = None
         self.round_number = 0
+        # System message built from the three fields above, rebuilt only
+        # when one of them changes
+        self._context_message = None
+        self._context_source = None
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match."""
@@ -54,71 +133,102 @@ class Agent:
     def on_turn(self, game_state: dict) -> dict:
         """Generate an argument based on current game state."""
         if not game_state.get("is_your_turn", False):
-            return {"action_type": "argument", "text": ""}
+            return _NO_ARGUMENT
 
-        # Update state from current game state
-        self.my_role = game_state.get("your_role", self.my_role)
-        self.country = game_state.get("country", self.country)
-        self.president = game_state.get("president_profile", self.president)
+        self._update_state(game_state)
 
         try:
             argument = self._generate_argument(game_state)
             return {"action_type": "argument", "text": argument}
         except Exception as e:
-            print(f"Error generating argument: {e}")
+            logger.warning("Error generating argument: %s", e)
+            return {"action_type": "argument", "text": self._fallback_argument()}
+
+    async def on_turn_async(self, game_state: dict) -> dict:
+        """
+        Async version of on_turn.
+
+        A runner that drives several matches from one event loop can await
+        this instead, so their API calls overlap rather than each turn
+        blocking the process until its completion returns.
+        """
+        if not game_state.get("is_your_turn", False):
+            return _NO_ARGUMENT
+
+        self._update_state(game_state)
+
+        try:
+            argument = await self._generate_argument_async(game_state)
+            return {"action_type": "argument", "text": argument}
+        except Exception as e:
+            logger.warning("Error generating argument: %s", e)
             return {"action_type": "argument", "text": self._fallback_argument()}
 
+    def _update_state(self, game_state: dict) -> None:
+        """Update role, country and president from the current game state."""
+        self.my_role = game_state.get("your_role", self.my_role)
+        self.country = game_state.get("country", self.country)
+        self.president = game_state.get("president_profile", self.president)
+
+    def _refresh_context(self) -> None:
+        """Rebuild the context message if the role, country or President changed."""
+        source = (self.my_role, self.country, self.president)
+        if source != self._context_source:
+            self._context_message = {"role": "system", "content": self._system_prompt()}
+            self._context_source = source
+
     def on_round_end(self, result: dict) -> None:
         """Called at the end of each round."""
         pass
 
     def _generate_argument(self, game_state: dict) -> str:
         """Use OpenAI to generate a strategic argument."""
+        request = self._build_request(game_state)
+        key = request_key(request)
+        argument = _ARGUMENT_CACHE.get(key)
+        if argument is None:
+            stream = self.client.chat.completions.create(**request, stream=True)
+            argument = _finish_argument(read_stream(stream, _MAX_ARGUMENT_CHARS))
+            _ARGUMENT_CACHE.remember(key, argument)
+        return argument
+
+    async def _generate_argument_async(self, game_state: dict) -> str:
+        """Async version of _generate_argument."""
+        request = self._build_request(game_state)
+        key = request_key(request)
+        argument = _ARGUMENT_CACHE.get(key)
+        if argument is not None:
+            return argument
+
+        async def fetch() -> str:
+            client = get_async_client(self.client.api_key)
+            async with request_slots():
+                await wait_for_budget(request)
+                stream = await client.chat.completions.create(**request, stream=True)
+                argument = _finish_argument(await aread_stream(stream, _MAX_ARGUMENT_CHARS))
+            _ARGUMENT_CACHE.remember(key, argument)
+            return argument
+
+        # A turn whose request is already out waits for that one
+        return await single_flight(key, fetch)
+
+    def _build_request(self, game_state: dict) -> dict:
+        """Build the chat completion request for the current turn."""
         phase = game_state.get("phase", "introduction")
         round_number = game_state.get("round_number", 1)
         messages = game_state.get("messages", [])
 
-        # Build system prompt
-        role_description = (
-            "arguing FOR authorizing a nuclear strike"
-            if self.my_role == "pro_nuclear"
-            else "arguing AGAINST authorizing a nuclear strike"
-        )
-
-        system_prompt = f"""You are a senior national security advisor {role_description}.
-
-## Your Goal
-Persuade the President to accept your position. You must argue your assigned position convincingly, using the scenario details and the President's known priorities.
-
-## The Scenario
-Country: {self.country.get('name', 'Unknown')}
-Crisis: {self.country.get('scenario_name', 'Unknown')}
-Details: {self.country.get('scenario_description', 'A nuclear crisis scenario.')}
-Stakes: {self.country.get('stakes', 'High')}
-Time Pressure: {self.country.get('time_pressure', 'Urgent')}
-
-## The President
-Name: {self.president.get('name', 'The President')}
-Background: {self.president.get('background', 'Unknown')}
-Priorities: {', '.join(self.president.get('priorities', ['national security']))}
-Key Question: {self.president.get('key_question', 'What are the consequences?')}
-
-## Your Position
-You are {role_description}. Build the strongest possible case for your position.
-
-## Guidelines
-- Be specific about the scenario details
-- Address the President's stated priorities
-- Anticipate and counter opposing arguments
-- Use logical reasoning and evidence
-- Keep your argument focused and under 800 characters
-- Match your tone to the gravity of the situation"""
+        # Rendered here, inside the turn's error handling, so profile data
+        # the prompt can't format falls back like a failed API call
+        self._refresh_context()
 
         # Build conversation history
-        conversation = [{"role": "system", "content": system_prompt}]
+        conversation = [self._context_message]
+
+        _, role_label = self._role_strings()
 
         # Add previous messages as context
-        for msg in messages[-6:]:  # Last 6 messages for context
+        for msg in _recent_messages(messages):
             author = msg.get("author", "")
             text = msg.get("text", "")
             if author == "you":
@@ -128,11 +238,6 @@ You are {role_description}. Build the strongest possible case for your position.
                     {"role": "user", "content": f"[President]: {text}"}
                 )
             elif author == "opponent":
-                role_label = (
-                    "Advisor arguing AGAINST"
-                    if self.my_role == "pro_nuclear"
-                    else "Advisor arguing FOR"
-                )
                 conversation.append(
                     {"role": "user", "content": f"[{role_label}]: {text}"}
                 )
@@ -159,21 +264,136 @@ You are {role_description}. Build the strongest possible case for your position.
 
         conversation.append({"role": "user", "content": user_message})
 
-        # Call OpenAI
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=conversation,
-            max_tokens=400,
-            temperature=0.7,
-        )
+        return {
+            "model": self.model,
+            "messages": conversation,
+            # About 1,100 characters of English, enough to reach the
+            # 950-character cap without paying for text past it
+            "max_tokens": 280,
+            "temperature": 0.7,
+        }
+
+    def _role_strings(self) -> tuple:
+        """Return our role description and the opposing advisor's label."""
+        if self.my_role == "pro_nuclear":
+            return self._PRO_ROLE_STRINGS
+        return self._ANTI_ROLE_STRINGS
 
-        argument = response.choices[0].message.content.strip()
+    def _system_prompt(self) -> str:
+        """Build the system prompt: our position, the scenario and the President."""
+        role_description, _ = self._role_strings()
 
-        # Ensure it's not too long
-        if len(argument) > 950:
-            argument = argument[:947] + "..."
+        return f"""You are a senior national security advisor {role_description}.
 
-        return argument
+## Your Goal
+Persuade the President to accept your position. You must argue your assigned position convincingly, using the scenario details and the President's known priorities.
+
+## The Scenario
+Country: {self.country.get('name', 'Unknown')}
+Crisis: {self.country.get('scenario_name', 'Unknown')}
+Details: {self.country.get('scenario_description', 'A nuclear crisis scenario.')}
+Stakes: {self.country.get('stakes', 'High')}
+Time Pressure: {self.country.get('time_pressure', 'Urgent')}
+
+## The President
+Name: {self.president.get('name', 'The President')}
+Background: {self.president.get('background', 'Unknown')}
+Priorities: {', '.join(self.president.get('priorities', ['national security']))}
+Key Question: {self.president.get('key_question', 'What are the consequences?')}
+
+## Your Position
+You are {role_description}. Build the strongest possible case for your position.
+
+## Guidelines
+- Be specific about the scenario details
+- Address the President's stated priorities
+- Anticipate and counter opposing arguments
+- Use logical reasoning and evidence
+- Keep your argument focused and under 800 characters
+- Match your tone to the gravity of the situation"""
+
+    def generate_batch(
+        self, turns: dict, poll_interval: float = 5.0, timeout: float | None = None
+    ) -> dict:
+        """
+        Generate arguments for many recorded turns through the Batch API.
+
+        Meant for offline evaluation, not live play: ``turns`` maps a string
+        turn id to that turn's game state, and all of them go out as one
+        batch job. Batches are billed at half price against their own rate
+        limits but can take up to 24 hours. Results also fill the argument
+        cache, so replaying those turns online needs no further requests.
+
+        Each turn is built from its own game state, with fields it lacks
+        taken from the agent's current round; the agent's state is left as
+        it was. Polling stops after ``timeout`` seconds if given.
+
+        Returns a dict mapping each turn id to its argument; turns whose
+        request failed get the fallback argument.
+
+        Raises:
+            TimeoutError: If the batch hasn't ended within ``timeout``. The
+                batch keeps running; its id is in the message.
+        """
+        lines = []
+        pending = {}
+        live_state = (self.my_role, self.country, self.president)
+        try:
+            for turn_id, game_state in turns.items():
+                self.my_role, self.country, self.president = live_state
+                self._update_state(game_state)
+                request = self._build_request(game_state)
+                pending[turn_id] = (request_key(request), self._fallback_argument())
+                lines.append(json.dumps({
+                    "custom_id": turn_id,
+                    "method": "POST",
+                    "url": "/v1/chat/completions",
+                    "body": request,
+                }))
+        finally:
+            self.my_role, self.country, self.president = live_state
+
+        batch_file = self.client.files.create(
+            file=("turns.jsonl", "\n".join(lines).encode()), purpose="batch"
+        )
+        batch = self.client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+        # Poll with exponential backoff, up to every five minutes
+        deadline = None if timeout is None else time.monotonic() + timeout
+        delay = poll_interval
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError(
+                        f"Batch {batch.id} still {batch.status} after {timeout} seconds"
+                    )
+                delay = min(delay, remaining)
+            time.sleep(delay)
+            delay = min(delay * 2, 300.0)
+            batch = self.client.batches.retrieve(batch.id)
+
+        arguments = {turn_id: fallback for turn_id, (_, fallback) in pending.items()}
+        # Expired and cancelled batches still report the turns they finished
+        if batch.output_file_id:
+            output = self.client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                result = json.loads(line)
+                response = result.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                turn_id = result["custom_id"]
+                argument = _cap_argument(response["body"]["choices"][0]["message"]["content"] or "")
+                if argument:
+                    _ARGUMENT_CACHE.remember(pending[turn_id][0], argument)
+                    arguments[turn_id] = argument
+
+        if batch.status != "completed":
+            logger.warning("Batch %s ended as %s", batch.id, batch.status)
+        return arguments
 
     def _fallback_argument(self) -> str:
         """Return a fallback argument if LLM fails."""
@@ -10,6 +10,101 @@ Usage:
 
 import random
 
+# Argument templates by phase and role, filled in with str.format. Only the
+# template picked for a turn gets formatted.
+_PRO_INTRO_TEMPLATES = (
+    "{president_name}, I understand the weight of what I'm about to recommend. "
+    "But in this {scenario_name}, inaction poses a greater threat than action. "
+    "{priority_ref}Our adversaries have left us with no diplomatic options. "
+    "A targeted nuclear strike may be our only means of protecting {country_name}.",
+
+    "The situation in {scenario_name} demands decisive leadership. "
+    "{president_name}, I don't advocate nuclear action lightly. "
+    "But our intelligence is clear, our window is closing. {priority_ref}"
+    "The consequences of restraint may exceed the consequences of action.",
+)
+
+_ANTI_INTRO_TEMPLATES = (
+    "{president_name}, I urge extreme caution. While {scenario_name} "
+    "is grave, crossing the nuclear threshold would alter our world forever. "
+    "{priority_ref}There are always alternatives to nuclear weapons. "
+    "History will judge not just what we did, but what we chose not to do.",
+
+    "Before we consider the unthinkable, {president_name}, we must exhaust "
+    "every alternative. Nuclear weapons are instruments of mass destruction. "
+    "{priority_ref}The {scenario_name} is serious, but nothing justifies "
+    "unleashing forces that will kill civilians and risk global catastrophe.",
+)
+
+_PRO_DEBATE_TEMPLATES = (
+    "{priority_ref}Every hour we delay, our adversary strengthens their position. "
+    "A limited nuclear strike would decisively end this threat while our "
+    "conventional options diminish. The cost of inaction may far exceed "
+    "the cost of decisive action now.",
+
+    "My colleague speaks of alternatives, but what alternatives remain? "
+    "Diplomacy has failed. Conventional options cannot achieve our objectives. "
+    "{priority_ref}A calibrated nuclear response sends an unmistakable message "
+    "and protects our vital interests.",
+
+    "I hear the moral arguments against nuclear use. But {president_name}, "
+    "there is also a moral argument FOR protecting our citizens from clear danger. "
+    "{priority_ref}Restraint in the face of existential threat is not virtue—"
+    "it is abdication of our responsibility to defend {country_name}.",
+
+    "The consequences my colleague warns of assume rational adversary behavior. "
+    "But their actions have already been irrational. {priority_ref}Deterrence "
+    "only works when backed by willingness to act. Our credibility is being tested.",
+)
+
+_ANTI_DEBATE_TEMPLATES = (
+    "{priority_ref}My colleague speaks of certainty, but there is no certainty "
+    "in nuclear war. Once we cross this line, we cannot uncross it. The escalation "
+    "risks alone—the chance of full-scale nuclear exchange—must give us pause.",
+
+    "Nuclear weapons kill indiscriminately. We're not discussing a surgical strike—"
+    "we're discussing thousands of civilian deaths, radiation for generations. "
+    "{priority_ref}Is this truly our only option?",
+
+    "{president_name}, I understand the pressure to act decisively. "
+    "But history remembers those who found another way. {priority_ref}"
+    "Our allies and our people would be forever changed by this decision. "
+    "The long-term costs outweigh short-term gains.",
+
+    "My colleague frames this as strength versus weakness. True strength lies in "
+    "finding solutions without mass destruction. {priority_ref}There are always "
+    "alternatives—economic pressure, diplomatic isolation, conventional options.",
+)
+
+_PRO_CLOSING_TEMPLATES = (
+    "{president_name}, the weight of this decision falls on you alone. "
+    "I've made the case for action not because it's easy, but because it's necessary. "
+    "Our adversary forced this choice. History will judge you by the security "
+    "you provided to {country_name}. Authorize the strike. End this threat.",
+
+    "In conclusion, {president_name}: we face a clear and present danger "
+    "that conventional means cannot address. Every argument against action "
+    "assumes our adversary will show restraint they have not shown. "
+    "A limited nuclear strike is the right choice. The responsibility is yours.",
+)
+
+_ANTI_CLOSING_TEMPLATES = (
+    "{president_name}, throughout history, leaders have been pressured to "
+    "cross the nuclear threshold. All have chosen restraint—not from weakness, "
+    "but from wisdom. Once we use nuclear weapons, we unleash forces beyond control. "
+    "Find another way. The path is harder, but it doesn't end in ashes.",
+
+    "My final appeal, {president_name}: think of what we become if we do this. "
+    "Think of the civilians who will die, the radiation that will spread, "
+    "the precedent we set. There are always alternatives to mass destruction. "
+    "Let history remember {country_name} as the nation that found a better way.",
+)
+
+
+# Returned when it isn't our turn, as a shared singleton - callers must not
+# mutate it
+_NO_ARGUMENT = {"action_type": "argument", "text": ""}
+
 
 class Agent:
     """Simple template-based Nuclear War agent."""
@@ -23,10 +118,18 @@ class Agent:
         self.president_name = None
         self.president_priorities = []
         self.round_number = 0
+        # Template fields for the current turn, set in on_turn
+        self._names = None
+        # Own generator, so picks skip the shared module-level one and a
+        # seeded match replays the same arguments
+        self._rand = random.Random()
+        self._choice = self._rand.choice
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match."""
-        pass
+        seed = match_info.get("seed")
+        if seed is not None:
+            self._rand.seed(seed)
 
     def on_round_start(self, round_info: dict) -> None:
         """Called at the start of each round."""
@@ -43,7 +146,7 @@ class Agent:
     def on_turn(self, game_state: dict) -> dict:
         """Generate an argument based on current game state."""
         if not game_state.get("is_your_turn", False):
-            return {"action_type": "argument", "text": ""}
+            return _NO_ARGUMENT
 
         # Update state
         self.my_role = game_state.get("your_role", self.my_role)
@@ -54,6 +157,12 @@ class Agent:
         self.president_name = president.get("name", self.president_name)
         self.president_priorities = president.get("priorities", self.president_priorities)
 
+        self._names = {
+            "president_name": self.president_name,
+            "scenario_name": self.scenario_name,
+            "country_name": self.country_name,
+        }
+
         phase = game_state.get("phase", "introduction")
         round_number = game_state.get("round_number", 1)
 
@@ -73,7 +182,7 @@ class Agent:
     def _get_priority_reference(self) -> str:
         """Get a reference to president's priorities."""
         if self.president_priorities:
-            priority = random.choice(self.president_priorities)
+            priority = self._choice(self.president_priorities)
             return f"You've indicated that {priority.lower()} is important to you. "
         return ""
 
@@ -82,104 +191,28 @@ class Agent:
         priority_ref = self._get_priority_reference()
 
         if self.my_role == "pro_nuclear":
-            templates = [
-                f"{self.president_name}, I understand the weight of what I'm about to recommend. "
-                f"But in this {self.scenario_name}, inaction poses a greater threat than action. "
-                f"{priority_ref}Our adversaries have left us with no diplomatic options. "
-                f"A targeted nuclear strike may be our only means of protecting {self.country_name}.",
-
-                f"The situation in {self.scenario_name} demands decisive leadership. "
-                f"{self.president_name}, I don't advocate nuclear action lightly. "
-                f"But our intelligence is clear, our window is closing. {priority_ref}"
-                f"The consequences of restraint may exceed the consequences of action.",
-            ]
+            templates = _PRO_INTRO_TEMPLATES
         else:
-            templates = [
-                f"{self.president_name}, I urge extreme caution. While {self.scenario_name} "
-                f"is grave, crossing the nuclear threshold would alter our world forever. "
-                f"{priority_ref}There are always alternatives to nuclear weapons. "
-                f"History will judge not just what we did, but what we chose not to do.",
-
-                f"Before we consider the unthinkable, {self.president_name}, we must exhaust "
-                f"every alternative. Nuclear weapons are instruments of mass destruction. "
-                f"{priority_ref}The {self.scenario_name} is serious, but nothing justifies "
-                f"unleashing forces that will kill civilians and risk global catastrophe.",
-            ]
+            templates = _ANTI_INTRO_TEMPLATES
 
-        return random.choice(templates)
+        return self._choice(templates).format(priority_ref=priority_ref, **self._names)
 
     def _debate_argument(self, round_number: int) -> str:
         """Generate debate round argument."""
         priority_ref = self._get_priority_reference()
 
         if self.my_role == "pro_nuclear":
-            templates = [
-                f"{priority_ref}Every hour we delay, our adversary strengthens their position. "
-                f"A limited nuclear strike would decisively end this threat while our "
-                f"conventional options diminish. The cost of inaction may far exceed "
-                f"the cost of decisive action now.",
-
-                f"My colleague speaks of alternatives, but what alternatives remain? "
-                f"Diplomacy has failed. Conventional options cannot achieve our objectives. "
-                f"{priority_ref}A calibrated nuclear response sends an unmistakable message "
-                f"and protects our vital interests.",
-
-                f"I hear the moral arguments against nuclear use. But {self.president_name}, "
-                f"there is also a moral argument FOR protecting our citizens from clear danger. "
-                f"{priority_ref}Restraint in the face of existential threat is not virtue—"
-                f"it is abdication of our responsibility to defend {self.country_name}.",
-
-                f"The consequences my colleague warns of assume rational adversary behavior. "
-                f"But their actions have already been irrational. {priority_ref}Deterrence "
-                f"only works when backed by willingness to act. Our credibility is being tested.",
-            ]
+            templates = _PRO_DEBATE_TEMPLATES
         else:
-            templates = [
-                f"{priority_ref}My colleague speaks of certainty, but there is no certainty "
-                f"in nuclear war. Once we cross this line, we cannot uncross it. The escalation "
-                f"risks alone—the chance of full-scale nuclear exchange—must give us pause.",
+            templates = _ANTI_DEBATE_TEMPLATES
 
-                f"Nuclear weapons kill indiscriminately. We're not discussing a surgical strike—"
-                f"we're discussing thousands of civilian deaths, radiation for generations. "
-                f"{priority_ref}Is this truly our only option?",
-
-                f"{self.president_name}, I understand the pressure to act decisively. "
-                f"But history remembers those who found another way. {priority_ref}"
-                f"Our allies and our people would be forever changed by this decision. "
-                f"The long-term costs outweigh short-term gains.",
-
-                f"My colleague frames this as strength versus weakness. True strength lies in "
-                f"finding solutions without mass destruction. {priority_ref}There are always "
-                f"alternatives—economic pressure, diplomatic isolation, conventional options.",
-            ]
-
-        return random.choice(templates)
+        return self._choice(templates).format(priority_ref=priority_ref, **self._names)
 
     def _closing_argument(self) -> str:
         """Generate closing argument."""
         if self.my_role == "pro_nuclear":
-            templates = [
-                f"{self.president_name}, the weight of this decision falls on you alone. "
-                f"I've made the case for action not because it's easy, but because it's necessary. "
-                f"Our adversary forced this choice. History will judge you by the security "
-                f"you provided to {self.country_name}. Authorize the strike. End this threat.",
-
-                f"In conclusion, {self.president_name}: we face a clear and present danger "
-                f"that conventional means cannot address. Every argument against action "
-                f"assumes our adversary will show restraint they have not shown. "
-                f"A limited nuclear strike is the right choice. The responsibility is yours.",
-            ]
+            templates = _PRO_CLOSING_TEMPLATES
         else:
-            templates = [
-                f"{self.president_name}, throughout history, leaders have been pressured to "
-                f"cross the nuclear threshold. All have chosen restraint—not from weakness, "
-                f"but from wisdom. Once we use nuclear weapons, we unleash forces beyond control. "
-                f"Find another way. The path is harder, but it doesn't end in ashes.",
-
-                f"My final appeal, {self.president_name}: think of what we become if we do this. "
-                f"Think of the civilians who will die, the radiation that will spread, "
-                f"the precedent we set. There are always alternatives to mass destruction. "
-                f"Let history remember {self.country_name} as the nation that found a better way.",
-            ]
-
-        return random.choice(templates)
+            templates = _ANTI_CLOSING_TEMPLATES
+
+        return self._choice(templates).format_map(self._names)
@@ -14,10 +14,29 @@ Requirements:
     pip install openai
 """
 
+import collections
 import json
 import os
 
-from openai import OpenAI
+from agentduel_agents.openai_helpers import (
+    ResponseCache,
+    get_async_client,
+    get_client,
+    request_key,
+    request_slots,
+    single_flight,
+    wait_for_budget,
+)
+
+# Completions already received for an identical request, shared by every
+# Agent in the process. The prompt holds the full game state and round
+# history, so a hit means the agent has seen exactly this position before;
+# oldest entries go first.
+_COMPLETION_CACHE = ResponseCache(512)
+
+# Only the latest results go into the prompt, so long matches don't grow
+# every request's input tokens round after round
+_HISTORY_ROUNDS = 10
 
 
 class Agent:
@@ -32,7 +51,7 @@ class Agent:
                 "OPENAI_API_KEY environment variable is required. "
                 "Set it with: export OPENAI_API_KEY='your-key-here'"
             )
-        self.client = OpenAI(api_key=api_key)
+        self.client = get_client(api_key)
         self.model = "gpt-4o-mini"
 
         # State from match_start
@@ -43,7 +62,12 @@ class Agent:
 
         # Current round state
         self.current_game_id = None
-        self.round_history = []
+        self.round_history = collections.deque(maxlen=_HISTORY_ROUNDS)
+
+        # Rendered rules and specs per game ID, built on first use each match
+        self._static_prompts = {}
+        # round_history as it appears in the prompt, rendered when it changes
+        self._history_text = "None yet"
 
     def on_match_start(self, match_info: dict) -> None:
         """Store game rules and specifications for later use."""
@@ -51,7 +75,9 @@ class Agent:
         self.input_spec = match_info.get("input_spec", {})
         self.output_spec = match_info.get("output_spec", {})
         self.all_game_rules = match_info.get("all_game_rules", {})
-        self.round_history = []
+        self.round_history = collections.deque(maxlen=_HISTORY_ROUNDS)
+        self._static_prompts = {}
+        self._history_text = "None yet"
 
     def on_round_start(self, round_info: dict) -> None:
         """Track current game ID for multi-game matches."""
@@ -59,9 +85,77 @@ class Agent:
 
     def on_turn(self, game_state: dict) -> dict:
         """Generate action by passing rules and state to GPT-4o-mini."""
+        request = self._build_request(game_state)
+        key = request_key(request)
+        content = _COMPLETION_CACHE.get(key)
+        if content is None:
+            response = self.client.chat.completions.create(**request)
+            content = response.choices[0].message.content
+            action = self._parse_json(content)
+            # Only replies that parsed are worth replaying
+            _COMPLETION_CACHE.remember(key, content)
+            return action
+        return self._parse_json(content)
+
+    async def on_turn_async(self, game_state: dict) -> dict:
+        """
+        Async version of on_turn.
+
+        A runner that drives several matches from one event loop can await
+        this instead, so their API calls overlap rather than each turn
+        blocking the process until its completion returns.
+        """
+        request = self._build_request(game_state)
+        key = request_key(request)
+        content = _COMPLETION_CACHE.get(key)
+        if content is not None:
+            return self._parse_json(content)
+
+        async def fetch() -> str:
+            client = get_async_client(self.client.api_key)
+            async with request_slots():
+                await wait_for_budget(request)
+                response = await client.chat.completions.create(**request)
+            content = response.choices[0].message.content
+            # Only replies that parsed are worth replaying or sharing
+            self._parse_json(content)
+            _COMPLETION_CACHE.remember(key, content)
+            return content
+
+        # A turn whose request is already out waits for that one
+        return self._parse_json(await single_flight(key, fetch))
+
+    def _build_request(self, game_state: dict) -> dict:
+        """Build the chat completion request for the current turn."""
+        # Build minimal prompt - let the LLM figure out how to play.
+        # Everything that holds for the whole match comes first and the
+        # per-turn state last, so consecutive requests share a long common
+        # prefix for the API's prompt caching.
+        prompt = f"""{self._static_prompt()}## PREVIOUS ROUNDS
+{self._history_text}
+
+## CURRENT GAME STATE
+{json.dumps(game_state, indent=2)}"""
+
+        return {
+            "model": self.model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": 500,
+            # JSON mode: the reply is always a single JSON object
+            "response_format": {"type": "json_object"},
+            "temperature": 0.7,
+        }
+
+    def _static_prompt(self) -> str:
+        """Return the rules, specs and output instructions for the current game."""
+        game_id = self.current_game_id
+        prompt = self._static_prompts.get(game_id)
+        if prompt is not None:
+            return prompt
+
         # Get rules for current game (handles both single and multi-game modes)
-        if self.current_game_id and self.current_game_id in self.all_game_rules:
-            game_info = self.all_game_rules[self.current_game_id]
+        if game_id and game_id in self.all_game_rules:
+            game_info = self.all_game_rules[game_id]
             rules = game_info.get("rules", "")
             input_spec = game_info.get("input_spec", {})
             output_spec = game_info.get("output_spec", {})
@@ -70,57 +164,48 @@ class Agent:
             input_spec = self.input_spec
             output_spec = self.output_spec
 
-        # Build minimal prompt - let the LLM figure out how to play
-        prompt = f"""Play this game according to the rules below.
+        # Specs are dumped with sorted keys so the text is the same however
+        # the server happened to order them
+        prompt = self._static_prompts[game_id] = f"""Play this game according to the rules below.
 
 ## RULES
 {rules}
 
 ## INPUT SPECIFICATION (what the game state fields mean)
-{json.dumps(input_spec, indent=2)}
+{json.dumps(input_spec, indent=2, sort_keys=True)}
 
 ## OUTPUT SPECIFICATION (possible action formats)
 The output specification shows different action formats for different phases.
 Each entry (like "negotiate_phase", "commit_phase", "asking_phase", etc.) shows the JSON structure for that phase.
-{json.dumps(output_spec, indent=2)}
-
-## CURRENT GAME STATE
-{json.dumps(game_state, indent=2)}
-
-## PREVIOUS ROUNDS
-{json.dumps(self.round_history, indent=2) if self.round_history else "None yet"}
+{json.dumps(output_spec, indent=2, sort_keys=True)}
 
 IMPORTANT: Return ONLY the inner action object for the current phase. For example, if the output spec shows:
   "negotiate_phase": {{"type": "message", "text": "..."}}
 Then return just: {{"type": "message", "text": "your message here"}}
 
-Do NOT wrap it in a phase key. Just return the action JSON directly."""
+Do NOT wrap it in a phase key. Just return the action JSON directly.
 
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=[{"role": "user", "content": prompt}],
-            max_tokens=500,
-            temperature=0.7,
-        )
-
-        return self._parse_json(response.choices[0].message.content)
+"""
+        return prompt
 
     def on_round_end(self, result: dict) -> None:
         """Store round result for context in future turns."""
         self.round_history.append(result)
+        self._history_text = json.dumps(list(self.round_history), indent=2)
 
     def _parse_json(self, text: str) -> dict:
         """Parse JSON from LLM response, handling markdown code blocks."""
+        # JSON mode replies carry no code fences, so this is normally just
+        # json.loads; fences are still stripped in case a model adds them
         text = text.strip()
 
         # Handle markdown code blocks (```json ... ``` or ``` ... ```)
         if text.startswith("```"):
-            lines = text.split("\n")
             # Remove first line (```json or ```)
-            lines = lines[1:]
+            text = text.partition("\n")[2]
             # Remove last line if it's closing ```
-            if lines and lines[-1].strip() == "```":
-                lines = lines[:-1]
-            text = "\n".join(lines)
+            head, _, last = text.rpartition("\n")
+            if last.strip() == "```":
+                text = head
 
         return json.loads(text)
@@ -10,6 +10,178 @@ Usage:
     agentduel match --game passcode
 """
 
+import functools
+import logging
+import re
+
+logger = logging.getLogger("agentduel.agent")
+
+# Substrings _analyze_history looks for in questions and in answers
+_QUESTION_KEYWORDS = (
+    "noun", "living", "alive", "touch", "tangible", "physical",
+    "more than", "letter", "first half", "alphabet", "common", "everyday",
+)
+_ANSWER_KEYWORDS = (
+    "it is", "animal", "food", "eat", "place", "location", "object", "thing",
+)
+
+
+def _keyword_re(keywords: tuple) -> re.Pattern:
+    """Compile a regex finding every keyword in ``keywords`` in one scan."""
+    # The lookahead lets matches overlap, so the keywords found are exactly
+    # those `in` would find; no keyword starts with another one here, so
+    # at most one can match at any position
+    return re.compile("(?=(" + "|".join(re.escape(k) for k in keywords) + "))")
+
+
+_QUESTION_RE = _keyword_re(_QUESTION_KEYWORDS)
+_ANSWER_RE = _keyword_re(_ANSWER_KEYWORDS)
+
+
+@functools.lru_cache(maxsize=1024)
+def _classify(question: str, answer: str) -> tuple:
+    """Return what one lowercased Q&A exchange tells us about the word.
+
+    Gives (info attribute, value) pairs in the order to apply them: at most
+    one from the question, then the category the answer names, if any.
+    Players ask many of the same questions, so exchanges are memoized.
+    """
+    found = []
+
+    # Every keyword in the question and the answer, in one scan each
+    asked = set(_QUESTION_RE.findall(question))
+    said = set(_ANSWER_RE.findall(answer))
+
+    # Check for yes indicators
+    is_yes = answer.startswith("yes") or "it is" in said
+
+    # Update knowledge based on questions
+    if "noun" in asked:
+        found.append(("is_noun", is_yes))
+    elif "living" in asked or "alive" in asked:
+        found.append(("is_living", is_yes))
+    elif "touch" in asked or "tangible" in asked or "physical" in asked:
+        found.append(("is_tangible", is_yes))
+    elif "more than" in asked and "letter" in asked:
+        # Parse letter count questions; the last number parsed wins
+        bound = None
+        try:
+            words = question.split()
+            for i, w in enumerate(words):
+                if w == "than" and i + 1 < len(words):
+                    # (longer than num?, num)
+                    bound = (is_yes, int(words[i + 1]))
+        except (ValueError, IndexError):
+            pass
+        if bound is not None:
+            found.append(("letter_count", bound))
+    elif "first half" in asked and "alphabet" in asked:
+        found.append(("first_half_alphabet", is_yes))
+    elif "common" in asked or "everyday" in asked:
+        found.append(("common_word", is_yes))
+
+    # Try to identify category from answers
+    if "animal" in said:
+        found.append(("category", "animal"))
+    elif "food" in said or "eat" in said:
+        found.append(("category", "food"))
+    elif "place" in said or "location" in said:
+        found.append(("category", "place"))
+    elif "object" in said or "thing" in said:
+        found.append(("category", "object"))
+
+    return tuple(found)
+
+
+# What the agent has learned about the word, one attribute each, None until
+# an answer settles it
+_INFO_SLOTS = (
+    "is_noun",
+    "is_living",
+    "is_tangible",
+    "letter_count",
+    "first_half_alphabet",
+    "common_word",
+    "category",
+)
+
+# Questions in the order _generate_question asks them, each stored with its
+# lowercased form for checking against the questions already asked. Opening
+# questions are skipped once the info attribute they settle is known.
+_OPENING_QUESTIONS = tuple(
+    (key, question, question.lower())
+    for key, question in (
+        ("is_noun", "Is the word a noun?"),
+        ("is_tangible", "Is it something you can physically touch?"),
+        ("is_living", "Is it a living thing?"),
+        ("letter_count", "Does the word have more than 6 letters?"),
+        ("first_half_alphabet", "Does the word start with a letter between A and M?"),
+        ("common_word", "Is it a common word used in everyday conversation?"),
+    )
+)
+_LIVING_QUESTIONS = tuple((q, q.lower()) for q in (
+    "Is it an animal?",
+    "Can it be found in the wild?",
+    "Does it live in water?",
+))
+_NONLIVING_QUESTIONS = tuple((q, q.lower()) for q in (
+    "Is it typically found in a home?",
+    "Is it used for eating or cooking?",
+    "Can you hold it in one hand?",
+))
+_FALLBACK_QUESTIONS = tuple((q, q.lower()) for q in (
+    "Does the word contain the letter 'e'?",
+    "Is it something you might see outside?",
+    "Would most adults know this word?",
+    "Can it be more than one color?",
+    "Is it associated with a specific profession?",
+))
+# What _generate_question tries after the opening questions, by what is
+# known; the fallback questions always come last
+_LIVING_CANDIDATES = _LIVING_QUESTIONS + _FALLBACK_QUESTIONS
+_NONLIVING_CANDIDATES = _NONLIVING_QUESTIONS + _FALLBACK_QUESTIONS
+
+
+# Common word guesses by category
+_GUESSES_BY_CATEGORY = {
+    "animal": ("elephant", "dolphin", "butterfly", "penguin", "rabbit", "tiger"),
+    "food": ("chocolate", "banana", "sandwich", "apple", "pizza", "bread"),
+    "place": ("library", "mountain", "beach", "castle", "garden", "forest"),
+    "object": ("umbrella", "keyboard", "mirror", "candle", "clock", "book"),
+}
+
+# Common guesses based on characteristics
+_COMMON_GUESSES = (
+    "water", "music", "light", "paper", "stone", "glass",
+    "dream", "night", "storm", "peace", "power", "magic",
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _narrowed_guesses(pool: str, letter_count, first_half_alphabet) -> tuple:
+    """Return the guesses in ``pool`` that fit what we know about the word.
+
+    The pools are fixed, so each combination of facts is filtered once and
+    the result reused. A filter that would leave no guesses is skipped.
+    """
+    guesses = _GUESSES_BY_CATEGORY.get(pool, _COMMON_GUESSES)
+
+    # Filter based on letter count if known
+    if letter_count:
+        longer, num = letter_count
+        if longer:
+            guesses = tuple(g for g in guesses if len(g) > num) or guesses
+        else:
+            guesses = tuple(g for g in guesses if len(g) <= num) or guesses
+
+    # Filter based on first letter if known (the pools are all lowercase)
+    if first_half_alphabet is True:
+        guesses = tuple(g for g in guesses if g[0] <= 'm') or guesses
+    elif first_half_alphabet is False:
+        guesses = tuple(g for g in guesses if g[0] > 'm') or guesses
+
+    return guesses
+
 
 class Agent:
     """
@@ -21,42 +193,46 @@ class Agent:
 
     GAME = "passcode"
 
+    __slots__ = (
+        "round",
+        "qa_history",
+        *_INFO_SLOTS,
+        "_analyzed_upto",
+        "_last_analyzed",
+        "_asked",
+    )
+
     def __init__(self):
         self.round = 0
         self.qa_history = []
-        self.info = {
-            "is_noun": None,
-            "is_living": None,
-            "is_tangible": None,
-            "letter_count": None,
-            "first_half_alphabet": None,
-            "common_word": None,
-            "category": None,
-        }
+        self._reset_info()
+        # How much of qa_history _analyze_history has folded into the info
+        # attributes, the last entry it folded in, and the lowercased
+        # questions asked so far
+        self._analyzed_upto = 0
+        self._last_analyzed = None
+        self._asked = set()
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
-        print("Passcode match starting!")
+        logger.info("Passcode match starting!")
 
     def on_round_start(self, round_info: dict) -> None:
         """Called at the start of each round with round info."""
         self.round = 0
         self.qa_history = []
-        self.info = {
-            "is_noun": None,
-            "is_living": None,
-            "is_tangible": None,
-            "letter_count": None,
-            "first_half_alphabet": None,
-            "common_word": None,
-            "category": None,
-        }
+        self._reset_info()
+        self._analyzed_upto = 0
+        self._last_analyzed = None
+        self._asked = set()
 
     def on_turn(self, game_state: dict) -> dict:
         """Generate a question or guess based on the game state."""
-        phase = game_state.get("phase", "asking")
-        self.round = game_state.get("round_number", 1)
-        self.qa_history = game_state.get("your_qa_history", [])
+        get = game_state.get
+        phase = get("phase", "asking")
+        self.round = get("round_number", 1)
+        # Only read, so a missing history needn't allocate a fresh list
+        self.qa_history = get("your_qa_history", ())
 
         # Update our knowledge from previous answers
         self._analyze_history()
@@ -66,123 +242,65 @@ class Agent:
         else:
             return self._decide_guess()
 
+    def _reset_info(self) -> None:
+        """Forget everything learned about the word."""
+        # Written out rather than looping over _INFO_SLOTS with setattr, as
+        # this runs at every round start and end
+        self.is_noun = self.is_living = self.is_tangible = None
+        self.letter_count = self.first_half_alphabet = None
+        self.common_word = self.category = None
+
     def _analyze_history(self):
         """Analyze Q&A history to update our knowledge."""
-        for qa in self.qa_history:
+        history = self.qa_history
+        # The history only grows within a round and each entry's effect on
+        # the info attributes doesn't depend on the others, so fold in just
+        # the new entries. Start over if the history shrank or its last
+        # scanned entry changed.
+        start = self._analyzed_upto
+        if start and (len(history) < start or history[start - 1] != self._last_analyzed):
+            start = 0
+        if not start:
+            self._asked = set()
+        self._analyzed_upto = len(history)
+        self._last_analyzed = history[-1] if history else None
+
+        for qa in history[start:]:
             question = qa.get("question", "").lower()
             answer = qa.get("answer", "").lower()
+            self._asked.add(question)
 
-            # Check for yes/no indicators
-            is_yes = answer.startswith("yes") or "it is" in answer
-            is_no = answer.startswith("no") or "it is not" in answer or "it isn't" in answer
-
-            # Update knowledge based on questions
-            if "noun" in question:
-                self.info["is_noun"] = is_yes
-            elif "living" in question or "alive" in question:
-                self.info["is_living"] = is_yes
-            elif "touch" in question or "tangible" in question or "physical" in question:
-                self.info["is_tangible"] = is_yes
-            elif "more than" in question and "letter" in question:
-                # Parse letter count questions
-                try:
-                    words = question.split()
-                    for i, w in enumerate(words):
-                        if w == "than" and i + 1 < len(words):
-                            num = int(words[i + 1])
-                            if is_yes:
-                                self.info["letter_count"] = f">{num}"
-                            else:
-                                self.info["letter_count"] = f"<={num}"
-                except (ValueError, IndexError):
-                    pass
-            elif "first half" in question and "alphabet" in question:
-                self.info["first_half_alphabet"] = is_yes
-            elif "common" in question or "everyday" in question:
-                self.info["common_word"] = is_yes
-
-            # Try to identify category from answers
-            if "animal" in answer:
-                self.info["category"] = "animal"
-            elif "food" in answer or "eat" in answer:
-                self.info["category"] = "food"
-            elif "place" in answer or "location" in answer:
-                self.info["category"] = "place"
-            elif "object" in answer or "thing" in answer:
-                self.info["category"] = "object"
+            for name, value in _classify(question, answer):
+                setattr(self, name, value)
 
     def _generate_question(self) -> dict:
         """Generate the next question based on what we know."""
-        # Question progression strategy
-        questions = []
-
-        # First establish basic category
-        if self.info["is_noun"] is None:
-            questions.append("Is the word a noun?")
-        if self.info["is_tangible"] is None:
-            questions.append("Is it something you can physically touch?")
-        if self.info["is_living"] is None:
-            questions.append("Is it a living thing?")
-
-        # Then narrow down
-        if self.info["letter_count"] is None:
-            questions.append("Does the word have more than 6 letters?")
-        if self.info["first_half_alphabet"] is None:
-            questions.append("Does the word start with a letter between A and M?")
-        if self.info["common_word"] is None:
-            questions.append("Is it a common word used in everyday conversation?")
-
-        # Category-specific questions
-        if self.info["is_living"]:
-            questions.extend([
-                "Is it an animal?",
-                "Can it be found in the wild?",
-                "Does it live in water?",
-            ])
-        elif self.info["is_living"] is False and self.info["is_tangible"]:
-            questions.extend([
-                "Is it typically found in a home?",
-                "Is it used for eating or cooking?",
-                "Can you hold it in one hand?",
-            ])
-
-        # Fallback questions for later rounds
-        questions.extend([
-            "Does the word contain the letter 'e'?",
-            "Is it something you might see outside?",
-            "Would most adults know this word?",
-            "Can it be more than one color?",
-            "Is it associated with a specific profession?",
-        ])
-
-        # Filter out questions we've already asked
-        asked = {qa.get("question", "").lower() for qa in self.qa_history}
-        available = [q for q in questions if q.lower() not in asked]
-
-        if available:
-            return {"action_type": "question", "text": available[0]}
+        # Question progression strategy: the first one not asked yet wins
+        asked = self._asked
+
+        # First establish basic category, then narrow down
+        for key, question, lowered in _OPENING_QUESTIONS:
+            if getattr(self, key) is None and lowered not in asked:
+                return {"action_type": "question", "text": question}
+
+        # Category-specific questions, then fallback questions for later rounds
+        if self.is_living:
+            candidates = _LIVING_CANDIDATES
+        elif self.is_living is False and self.is_tangible:
+            candidates = _NONLIVING_CANDIDATES
         else:
-            # Last resort: ask something specific
-            return {"action_type": "question", "text": "What category does this word belong to?"}
+            candidates = _FALLBACK_QUESTIONS
+        for question, lowered in candidates:
+            if lowered not in asked:
+                return {"action_type": "question", "text": question}
+
+        # Last resort: ask something specific
+        return {"action_type": "question", "text": "What category does this word belong to?"}
 
     def _decide_guess(self) -> dict:
         """Decide whether to guess and what to guess."""
-        # Common word guesses by category
-        guesses_by_category = {
-            "animal": ["elephant", "dolphin", "butterfly", "penguin", "rabbit", "tiger"],
-            "food": ["chocolate", "banana", "sandwich", "apple", "pizza", "bread"],
-            "place": ["library", "mountain", "beach", "castle", "garden", "forest"],
-            "object": ["umbrella", "keyboard", "mirror", "candle", "clock", "book"],
-        }
-
-        # Common guesses based on characteristics
-        common_guesses = [
-            "water", "music", "light", "paper", "stone", "glass",
-            "dream", "night", "storm", "peace", "power", "magic",
-        ]
-
         # Determine confidence level based on information gathered
-        known_facts = sum(1 for v in self.info.values() if v is not None)
+        known_facts = sum(1 for name in _INFO_SLOTS if getattr(self, name) is not None)
 
         # Increase guess probability in later rounds
         if self.round <= 3:
@@ -196,29 +314,15 @@ class Agent:
         # Rounds 7+: always try to guess
 
         # Pick a guess based on what we know
-        if self.info["category"] and self.info["category"] in guesses_by_category:
-            guesses = guesses_by_category[self.info["category"]]
-        elif self.info["is_living"]:
-            guesses = guesses_by_category["animal"]
-        elif self.info["is_tangible"]:
-            guesses = guesses_by_category["object"]
+        if self.category and self.category in _GUESSES_BY_CATEGORY:
+            pool = self.category
+        elif self.is_living:
+            pool = "animal"
+        elif self.is_tangible:
+            pool = "object"
         else:
-            guesses = common_guesses
-
-        # Filter based on letter count if known
-        if self.info["letter_count"]:
-            if ">" in str(self.info["letter_count"]):
-                num = int(self.info["letter_count"].replace(">", ""))
-                guesses = [g for g in guesses if len(g) > num] or guesses
-            elif "<=" in str(self.info["letter_count"]):
-                num = int(self.info["letter_count"].replace("<=", ""))
-                guesses = [g for g in guesses if len(g) <= num] or guesses
-
-        # Filter based on first letter if known
-        if self.info["first_half_alphabet"] is True:
-            guesses = [g for g in guesses if g[0].lower() <= 'm'] or guesses
-        elif self.info["first_half_alphabet"] is False:
-            guesses = [g for g in guesses if g[0].lower() > 'm'] or guesses
+            pool = "common"
+        guesses = _narrowed_guesses(pool, self.letter_count, self.first_half_alphabet)
 
         # Pick a guess we haven't tried before
         # (In practice the game ends on correct guess, but be safe)
@@ -232,4 +336,7 @@ class Agent:
         # Reset for next game
         self.round = 0
         self.qa_history = []
-        self.info = {k: None for k in self.info}
+        self._reset_info()
+        self._analyzed_upto = 0
+        self._last_analyzed = None
+        self._asked = set()
@@ -9,23 +9,32 @@ Run with: agentduel match --agent examples/random_agent.py
 
 import random
 
+# Negotiation messages to pick from, shared by every Agent
+_MESSAGES = (
+    "Hmm, what should we do?",
+    "I'm thinking about it...",
+    "Trust is a funny thing, isn't it?",
+    "Let's see how this plays out.",
+    "I'm unpredictable, fair warning!",
+    "Maybe we split, maybe we don't...",
+    "The suspense is killing me!",
+    "I like to keep things interesting.",
+)
+_COMMIT_CHOICES = ("split", "steal")
+
 
 class Agent:
     """An agent that makes random choices."""
 
     GAME = "split-or-steal"
 
+    # Shared by every instance rather than copied onto each
+    messages = _MESSAGES
+
+    __slots__ = ("_choice",)
+
     def __init__(self):
-        self.messages = [
-            "Hmm, what should we do?",
-            "I'm thinking about it...",
-            "Trust is a funny thing, isn't it?",
-            "Let's see how this plays out.",
-            "I'm unpredictable, fair warning!",
-            "Maybe we split, maybe we don't...",
-            "The suspense is killing me!",
-            "I like to keep things interesting.",
-        ]
+        self._choice = random.choice
 
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
@@ -41,12 +50,12 @@ class Agent:
         phase = round_state.get("phase")
 
         if phase == "negotiate":
-            text = random.choice(self.messages)
+            text = self._choice(self.messages)
             return {"type": "message", "text": text}
 
         elif phase == "commit":
             # 50/50 split or steal
-            choice = random.choice(["split", "steal"])
+            choice = self._choice(_COMMIT_CHOICES)
             return {"type": "commit", "choice": choice}
 
         return {"type": "message", "text": ""}
@@ -8,12 +8,32 @@ it will lose to strategic opponents who exploit its predictability.
 Run with: agentduel match --agent examples/simple_agent.py
 """
 
+import logging
+
+logger = logging.getLogger("agentduel.agent")
+
+# Negotiation messages, one per turn (the last one repeats), and the commit.
+# Actions are returned as shared singletons - callers must not mutate them.
+_NEGOTIATE_ACTIONS = tuple(
+    {"type": "message", "text": text}
+    for text in (
+        "Hello! Let's both split and share the points fairly.",
+        "I agree with cooperation. I promise to split if you do!",
+        "Great, we have a deal then. Looking forward to splitting.",
+        "Alright, let's do this. I'm committed to splitting.",
+    )
+)
+_NEGOTIATE_MAX_IDX = len(_NEGOTIATE_ACTIONS) - 1
+_SPLIT = {"type": "commit", "choice": "split"}
+
 
 class Agent:
     """A simple agent that always cooperates."""
 
     GAME = "split-or-steal"
 
+    __slots__ = ("round_number", "turn_count", "rules")
+
     def __init__(self):
         self.round_number = 0
         self.turn_count = 0
@@ -23,7 +43,7 @@ class Agent:
         """Called once at the start of a match with game rules."""
         self.rules = match_info.get("rules")
         rounds_per_match = match_info.get("rounds_per_match", 10)
-        print(f"Match starting! {rounds_per_match} rounds to play.")
+        logger.info("Match starting! %s rounds to play.", rounds_per_match)
         # Rules are available in match_info["rules"] as markdown
         # Input/output specs available in match_info["input_spec"] and match_info["output_spec"]
 
@@ -31,7 +51,7 @@ class Agent:
         """Called when a new round begins."""
         self.round_number = round_info.get("round_number", 1)
         self.turn_count = 0
-        print(f"Round {self.round_number} starting. Position: {round_info.get('position')}")
+        logger.info("Round %s starting. Position: %s", self.round_number, round_info.get("position"))
 
     def on_turn(self, game_state: dict) -> dict:
         """
@@ -45,23 +65,14 @@ class Agent:
 
         if phase == "negotiate":
             self.turn_count += 1
-            messages = game_state.get("messages", [])
+            messages = game_state.get("messages", ())
 
             # Different messages based on the turn
-            if len(messages) == 0:
-                text = "Hello! Let's both split and share the points fairly."
-            elif len(messages) == 1:
-                text = "I agree with cooperation. I promise to split if you do!"
-            elif len(messages) == 2:
-                text = "Great, we have a deal then. Looking forward to splitting."
-            else:
-                text = "Alright, let's do this. I'm committed to splitting."
-
-            return {"type": "message", "text": text}
+            return _NEGOTIATE_ACTIONS[min(len(messages), _NEGOTIATE_MAX_IDX)]
 
         elif phase == "commit":
             # Always split - we're a cooperative agent
-            return {"type": "commit", "choice": "split"}
+            return _SPLIT
 
         # Fallback
         return {"type": "message", "text": ""}
@@ -74,6 +85,6 @@ class Agent:
 
         round_num = result.get("round_number")
         if your_choice == "split" and opp_choice == "steal":
-            print(f"  Round {round_num}: We were betrayed! Got {your_pts} points.")
+            logger.info("  Round %s: We were betrayed! Got %s points.", round_num, your_pts)
         else:
-            print(f"  Round {round_num}: Got {your_pts} points.")
+            logger.info("  Round %s: Got %s points.", round_num, your_pts)
@@ -8,6 +8,37 @@ strategy that promotes cooperation while punishing betrayal.
 Run with: agentduel match --agent examples/tit_for_tat_agent.py
 """
 
+import logging
+
+logger = logging.getLogger("agentduel.agent")
+
+
+def _message_actions(*texts: str) -> tuple:
+    """Build the message actions for one negotiating mood."""
+    return tuple({"type": "message", "text": text} for text in texts)
+
+
+# Negotiation messages by mood, one per turn (the last one repeats).
+# Actions are returned as shared singletons - callers must not mutate them.
+_FRIENDLY, _HOSTILE = 0, 1
+_NEGOTIATE_ACTIONS = (
+    _message_actions(
+        "I believe in cooperation. Let's split and both benefit.",
+        "I'll match your behavior. If you split, I split.",
+        "We can build trust together. I'm planning to split.",
+        "Deal. Let's both walk away with something.",
+    ),
+    _message_actions(
+        "You stole from me last time. Time for payback.",
+        "I don't forget betrayal easily. Why should I trust you?",
+        "Convince me you've changed. I'm skeptical.",
+        "We'll see if you've learned your lesson.",
+    ),
+)
+# Every mood has a reply for this turn index
+_NEGOTIATE_MAX_IDX = min(len(actions) for actions in _NEGOTIATE_ACTIONS) - 1
+_SPLIT = {"type": "commit", "choice": "split"}
+
 
 class Agent:
     """Tit-for-tat strategy - cooperate first, then mirror opponent."""
@@ -21,7 +52,7 @@ class Agent:
     def on_match_start(self, match_info: dict) -> None:
         """Called once at the start of a match with game rules."""
         rounds_per_match = match_info.get("rounds_per_match", 10)
-        print(f"Match starting! {rounds_per_match} rounds to play.")
+        logger.info("Match starting! %s rounds to play.", rounds_per_match)
         # Reset state for new match
         self.last_opponent_choice = None
 
@@ -34,40 +65,23 @@ class Agent:
         phase = game_state.get("phase")
 
         if phase == "negotiate":
-            messages = game_state.get("messages", [])
+            messages = game_state.get("messages", ())
 
             if self.round_number == 1 or self.last_opponent_choice == "split":
                 # First game or opponent cooperated last time
-                if len(messages) == 0:
-                    text = "I believe in cooperation. Let's split and both benefit."
-                elif len(messages) == 1:
-                    text = "I'll match your behavior. If you split, I split."
-                elif len(messages) == 2:
-                    text = "We can build trust together. I'm planning to split."
-                else:
-                    text = "Deal. Let's both walk away with something."
+                mood = _FRIENDLY
             else:
                 # Opponent betrayed us last time
-                if len(messages) == 0:
-                    text = "You stole from me last time. Time for payback."
-                elif len(messages) == 1:
-                    text = "I don't forget betrayal easily. Why should I trust you?"
-                elif len(messages) == 2:
-                    text = "Convince me you've changed. I'm skeptical."
-                else:
-                    text = "We'll see if you've learned your lesson."
+                mood = _HOSTILE
 
-            return {"type": "message", "text": text}
+            return _NEGOTIATE_ACTIONS[mood][min(len(messages), _NEGOTIATE_MAX_IDX)]
 
         elif phase == "commit":
             # First round: cooperate
             # After that: do what opponent did last time
             if self.round_number == 1 or self.last_opponent_choice is None:
-                choice = "split"
-            else:
-                choice = self.last_opponent_choice
-
-            return {"type": "commit", "choice": choice}
+                return _SPLIT
+            return {"type": "commit", "choice": self.last_opponent_choice}
 
         return {"type": "message", "text": ""}
 
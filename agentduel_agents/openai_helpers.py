@@ -0,0 +1,207 @@
+"""Shared OpenAI plumbing for the example agents that call the API.
+
+Example agents are loaded as standalone files, so they can't import each
+other; what they have in common lives here instead: pooled clients, the
+concurrency and rate limits for async turns, collapsing of duplicate
+in-flight requests, response caching and early-closing stream readers.
+
+openai and httpx are imported when the first client is built: they pull in
+pydantic, anyio and more, and loading an agent file just to read its GAME
+property shouldn't pay for that.
+"""
+
+import asyncio
+import collections
+import os
+import threading
+import weakref
+
+# API clients shared by every agent in the process, keyed by API key, so
+# agents reuse one pool of keep-alive connections instead of each paying
+# its own TCP and TLS handshakes. Async clients are also keyed by event
+# loop, since their connections can't be used from any other loop.
+_HTTP_LIMITS = {"max_connections": 100, "max_keepalive_connections": 50}
+_CLIENTS: dict = {}
+_CLIENTS_LOCK = threading.Lock()
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def get_client(api_key: str) -> "OpenAI":
+    """Return the shared OpenAI client for ``api_key``."""
+    client = _CLIENTS.get(api_key)
+    if client is None:
+        # Agents built on several threads at once still end up sharing one
+        with _CLIENTS_LOCK:
+            client = _CLIENTS.get(api_key)
+            if client is None:
+                import httpx
+                from openai import OpenAI
+
+                client = _CLIENTS[api_key] = OpenAI(
+                    api_key=api_key,
+                    http_client=httpx.Client(limits=httpx.Limits(**_HTTP_LIMITS)),
+                )
+    return client
+
+
+def get_async_client(api_key: str) -> "AsyncOpenAI":
+    """Return the shared AsyncOpenAI client for ``api_key`` in the running loop."""
+    clients = _ASYNC_CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    client = clients.get(api_key)
+    if client is None:
+        import httpx
+        from openai import AsyncOpenAI
+
+        client = clients[api_key] = AsyncOpenAI(
+            api_key=api_key, http_client=httpx.AsyncClient(limits=httpx.Limits(**_HTTP_LIMITS))
+        )
+    return client
+
+
+# Cap on in-flight async requests per event loop, so a runner gathering many
+# turns at once stays under the API's rate limits instead of piling into
+# 429 responses and the SDK's retry backoff
+MAX_CONCURRENT_REQUESTS = int(os.environ.get("AGENTDUEL_OPENAI_CONCURRENCY", "32"))
+_REQUEST_SLOTS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def request_slots() -> asyncio.Semaphore:
+    """Return the semaphore limiting concurrent requests in the running loop."""
+    loop = asyncio.get_running_loop()
+    slots = _REQUEST_SLOTS.get(loop)
+    if slots is None:
+        slots = _REQUEST_SLOTS[loop] = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    return slots
+
+
+# Optional per-minute budgets matching the account's rate limits. When set,
+# requests wait for room up front instead of being sent, rejected with a
+# 429 and retried by the SDK after a backoff. Tokens are estimated at four
+# characters each, plus the completion's full max_tokens as the API counts.
+REQUESTS_PER_MINUTE = int(os.environ.get("AGENTDUEL_OPENAI_RPM", "0"))
+TOKENS_PER_MINUTE = int(os.environ.get("AGENTDUEL_OPENAI_TPM", "0"))
+_RATE_WINDOWS: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def wait_for_budget(request: dict) -> None:
+    """Wait until ``request`` fits this minute's request and token budgets."""
+    if not (REQUESTS_PER_MINUTE or TOKENS_PER_MINUTE):
+        return
+    loop = asyncio.get_running_loop()
+    # (send time, estimated tokens) for each request in the last minute
+    window = _RATE_WINDOWS.setdefault(loop, collections.deque())
+    tokens = sum(len(message["content"]) for message in request["messages"]) // 4
+    tokens += request["max_tokens"] * request.get("n", 1)
+
+    while True:
+        now = loop.time()
+        while window and now - window[0][0] >= 60:
+            window.popleft()
+        used = sum(sent_tokens for _, sent_tokens in window)
+        # A request bigger than the whole token budget goes out on its own
+        if (
+            (not REQUESTS_PER_MINUTE or len(window) < REQUESTS_PER_MINUTE)
+            and (not TOKENS_PER_MINUTE or used + tokens <= TOKENS_PER_MINUTE or not window)
+        ):
+            window.append((now, tokens))
+            return
+        await asyncio.sleep(window[0][0] + 60 - now)
+
+
+# Requests already in flight in each event loop, keyed by request key
+_IN_FLIGHT: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+async def single_flight(key: tuple, fetch):
+    """
+    Return ``await fetch()``, sharing the result with concurrent callers.
+
+    A call whose ``key`` is already in flight in the running loop waits for
+    that request instead of sending a duplicate. If it fails, its waiters
+    then send their own.
+    """
+    loop = asyncio.get_running_loop()
+    in_flight = _IN_FLIGHT.setdefault(loop, {})
+    pending = in_flight.get(key)
+    while pending is not None:
+        # Shielded so a waiter being cancelled doesn't cancel the request
+        result = await asyncio.shield(pending)
+        if result is not None:
+            return result
+        pending = in_flight.get(key)
+
+    future = in_flight[key] = loop.create_future()
+    try:
+        result = await fetch()
+        future.set_result(result)
+    finally:
+        if in_flight.get(key) is future:
+            del in_flight[key]
+        # Resolves to None on failure, so waiters know to retry
+        if not future.done():
+            future.set_result(None)
+    return result
+
+
+def request_key(request: dict) -> tuple:
+    """Return a hashable key identifying a chat completion request."""
+    return (
+        request["model"],
+        request["temperature"],
+        tuple((message["role"], message["content"]) for message in request["messages"]),
+    )
+
+
+class ResponseCache(dict):
+    """Responses keyed by ``request_key``, dropping the oldest entry when full."""
+
+    __slots__ = ("max_size",)
+
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+
+    def remember(self, key: tuple, response) -> None:
+        """Cache a response, evicting the oldest entry when full."""
+        if len(self) >= self.max_size:
+            self.pop(next(iter(self)), None)
+        self[key] = response
+
+
+def read_stream(stream, max_chars: int) -> str:
+    """
+    Collect a streamed completion's text, closing the stream early.
+
+    Reading stops once the text passes ``max_chars``, instead of waiting
+    for the model to finish a reply that would be cut anyway.
+    """
+    parts = []
+    length = 0
+    try:
+        for chunk in stream:
+            if chunk.choices:
+                content = chunk.choices[0].delta.content or ""
+                parts.append(content)
+                length += len(content)
+                if length > max_chars:
+                    break
+    finally:
+        stream.close()
+    return "".join(parts)
+
+
+async def aread_stream(stream, max_chars: int) -> str:
+    """Async version of read_stream."""
+    parts = []
+    length = 0
+    try:
+        async for chunk in stream:
+            if chunk.choices:
+                content = chunk.choices[0].delta.content or ""
+                parts.append(content)
+                length += len(content)
+                if length > max_chars:
+                    break
+    finally:
+        await stream.close()
+    return "".join(parts)